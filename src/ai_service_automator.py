@@ -3,27 +3,119 @@ AI 서비스 자동화 모듈
 ChatGPT, Claude, Gemini에 자동으로 프롬프트와 이미지 업로드
 """
 
-import time
 import os
-from typing import Dict, List, Optional, Tuple
+import json
+import signal
+import asyncio
+import hashlib
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlsplit
 
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from loguru import logger
 
-from .config import Config
+from .config import Config, DEFAULT_BLOCKED_URLS
 from .stock_data_collector import StockData
 
 
+# 서비스별 요소 로케이터 (XPath 대신 CSS 선택자)
+CHATGPT_TEXTAREA = (By.CSS_SELECTOR, "textarea[data-id='root']")
+CHATGPT_SEND = (By.CSS_SELECTOR, "button[data-testid='send-button']")
+CHATGPT_ATTACHMENT = (By.CSS_SELECTOR, "[data-testid='attachment']")
+CHATGPT_NEW_CHAT = (By.CSS_SELECTOR, "a[href='/']")
+CLAUDE_EDITOR = (By.CSS_SELECTOR, "div[contenteditable='true']")
+CLAUDE_ATTACHMENT = (By.CSS_SELECTOR, "[data-testid='file-thumbnail']")
+GEMINI_TEXTAREA = (By.CSS_SELECTOR, "textarea")
+GEMINI_UPLOAD = (By.CSS_SELECTOR, "button[aria-label*='Upload']")
+GEMINI_SEND = (By.CSS_SELECTOR, "button[aria-label*='Send']")
+GEMINI_ATTACHMENT = (By.CSS_SELECTOR, "uploader-file-preview")
+FILE_INPUT = (By.CSS_SELECTOR, "input[type='file']")
+
+# 이미지 해시 캐시 파일 (경로별 크기/수정시각/SHA-256)
+UPLOAD_HASH_CACHE_PATH = Path("~/.cache/magicsplitgpt/upload_hashes.json").expanduser()
+
+# 입력 영역에 포커스를 주고 기존 내용을 선택 (이후 삽입되는 텍스트가 내용을 대체)
+_FOCUS_AND_SELECT_JS = """
+arguments[0].focus();
+document.execCommand('selectAll', false, null);
+"""
+
+# CDP 입력이 불가능할 때 사용하는 대체 입력 스크립트
+_SET_TEXT_JS = """
+const [input, text] = arguments;
+if (input.isContentEditable) {
+    input.innerText = text;
+} else {
+    const proto = Object.getPrototypeOf(input);
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(input, text);
+}
+input.dispatchEvent(new InputEvent('input', {bubbles: true}));
+"""
+
+# 선택자에 맞는 요소가 있으면 클릭하고 클릭 여부 반환
+_CLICK_IF_PRESENT_JS = """
+const el = document.querySelector(arguments[0]);
+if (el) {
+    el.click();
+    return true;
+}
+return false;
+"""
+
+# 전송 버튼이 활성화되면 클릭 - execute_async_script용
+# arguments: [전송 버튼 CSS, 제한시간(ms), 콜백]
+_SEND_WHEN_READY_JS = """
+const [sendSelector, timeoutMs, done] = arguments;
+
+const deadline = Date.now() + timeoutMs;
+(function clickWhenEnabled() {
+    const button = document.querySelector(sendSelector);
+    if (button && !button.disabled && button.getAttribute('aria-disabled') !== 'true') {
+        button.click();
+        done(true);
+    } else if (Date.now() > deadline) {
+        done('전송 버튼 활성화 대기 시간 초과: ' + sendSelector);
+    } else {
+        setTimeout(clickWhenEnabled, 50);
+    }
+})();
+"""
+
+# Enter 키 전송 후 입력 영역이 비워질 때까지 대기 (비워지면 전송된 것으로 판단) - execute_async_script용
+# arguments: [입력 영역 요소, 제한시간(ms), 콜백]
+_WAIT_INPUT_CLEARED_JS = """
+const [input, timeoutMs, done] = arguments;
+const text = () => (input.isContentEditable ? input.innerText : input.value).trim();
+
+const deadline = Date.now() + timeoutMs;
+(function waitCleared() {
+    if (!input.isConnected || text() === '') {
+        done(true);
+    } else if (Date.now() > deadline) {
+        done('전송 확인 대기 시간 초과: 입력 내용이 남아 있습니다');
+    } else {
+        setTimeout(waitCleared, 50);
+    }
+})();
+"""
+
+# 업로드 이미지 항목: (파일 경로, 로그용 파일명)
+ImageEntry = Tuple[str, str]
+
+
 @dataclass
 class AIServiceResult:
     """AI 서비스 업로드 결과"""
@@ -34,6 +126,15 @@ class AIServiceResult:
     response_url: Optional[str] = None
 
 
+@dataclass(slots=True, frozen=True)
+class _ServiceSpec:
+    """AI 서비스 설정 (이름, URL, 활성화 여부, 업로드 핸들러)"""
+    name: str
+    url: str
+    enabled: bool
+    handler: Callable[..., AIServiceResult]
+
+
 class AIServiceAutomator:
     """AI 서비스 자동화 클래스"""
     
@@ -45,25 +146,115 @@ class AIServiceAutomator:
             config: 설정 객체
         """
         self.config = config
-        self.driver: Optional[uc.Chrome] = None
-        self.wait: Optional[WebDriverWait] = None
-        
-        # AI 서비스 URL 매핑
-        self.service_urls = {
-            "chatgpt": self.config.ai_services.chatgpt["url"],
-            "claude": self.config.ai_services.claude["url"], 
-            "gemini": self.config.ai_services.gemini["url"]
-        }
-        
-        # 서비스 활성화 상태
-        self.enabled_services = {
-            "chatgpt": self.config.ai_services.chatgpt["enabled"],
-            "claude": self.config.ai_services.claude["enabled"],
-            "gemini": self.config.ai_services.gemini["enabled"]
-        }
-    
-    def _setup_driver(self) -> None:
-        """Chrome 드라이버 설정"""
+        
+        # AI 서비스 목록 (URL, 활성화 여부, 업로드 핸들러를 한 곳에 묶음)
+        self.services: List[_ServiceSpec] = [
+            _ServiceSpec(
+                name=name,
+                url=getattr(self.config.ai_services, name)["url"],
+                enabled=getattr(self.config.ai_services, name)["enabled"],
+                handler=handler
+            )
+            for name, handler in self.SERVICE_HANDLERS.items()
+        ]
+        
+        # 기본 업로드 대상 (활성화된 서비스, 호출마다 다시 계산하지 않음)
+        self._default_services: Tuple[_ServiceSpec, ...] = tuple(
+            spec for spec in self.services if spec.enabled
+        )
+        self._services_by_name: Dict[str, _ServiceSpec] = {spec.name: spec for spec in self.services}
+        
+        # 병렬 업로드 중 수동 로그인 안내(input)가 서로 섞이지 않도록 직렬화
+        self._login_prompt_lock = threading.Lock()
+        
+        # 서비스별 드라이버 (여러 번의 업로드에서 재사용, close()에서 종료)
+        self._drivers: Dict[str, uc.Chrome] = {}
+        self._drivers_lock = threading.Lock()
+        
+        # 서비스별 업로드 작업 스레드 (서비스 수만큼 동시에 실행)
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=len(self.SERVICE_HANDLERS), thread_name_prefix="ai-upload"
+        )
+        
+        # 이미지 경로별 크기/수정시각/SHA-256 (중복 이미지는 prepare_stock_data_for_upload에서 한 번만 제외)
+        self._hash_cache: Dict[str, Dict[str, object]] = self._load_upload_hashes()
+    
+    def _load_upload_hashes(self) -> Dict[str, Dict[str, object]]:
+        """이미지 해시 캐시 로드"""
+        try:
+            with open(UPLOAD_HASH_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"이미지 해시 캐시 로드 실패: {e}")
+            return {}
+    
+    def _save_upload_hashes(self) -> None:
+        """이미지 해시 캐시 저장"""
+        try:
+            UPLOAD_HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(UPLOAD_HASH_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self._hash_cache, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"이미지 해시 캐시 저장 실패: {e}")
+    
+    def _get_image_hash(self, path: str) -> str:
+        """
+        이미지 SHA-256 계산 (크기/수정시각이 같으면 캐시 사용)
+        
+        Args:
+            path: 이미지 파일 경로
+            
+        Returns:
+            16진수 SHA-256 문자열
+        """
+        stat = os.stat(path)
+        cached = self._hash_cache.get(path)
+        if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime:
+            return cached["sha256"]
+        
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        self._hash_cache[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": digest}
+        return digest
+    
+    def _get_service_profile_dir(self, service: str) -> str:
+        """
+        서비스별 Chrome 프로필 디렉토리 반환
+        
+        같은 프로필은 동시에 두 브라우저에서 열 수 없으므로 서비스마다 하위 폴더를 사용한다.
+        profile_dir/base 프로필이 있으면 최초 1회 복사해 로그인 상태를 이어받는다.
+        
+        Args:
+            service: 서비스 이름
+            
+        Returns:
+            프로필 디렉토리 경로
+        """
+        profile_root = Path(self.config.webdriver.profile_dir)
+        service_dir = profile_root / service
+        base_dir = profile_root / "base"
+        
+        if not service_dir.exists():
+            if base_dir.exists():
+                shutil.copytree(base_dir, service_dir)
+                logger.info(f"기본 프로필 복사 완료: {base_dir} -> {service_dir}")
+            else:
+                service_dir.mkdir(parents=True, exist_ok=True)
+        
+        return str(service_dir)
+    
+    def _setup_driver_instance(self, user_data_dir: str, blocked_urls: List[str]) -> uc.Chrome:
+        """
+        서비스별 독립 Chrome 드라이버 생성
+        
+        Args:
+            user_data_dir: 이 드라이버 전용 Chrome 프로필 디렉토리
+            blocked_urls: 네트워크 단에서 차단할 URL 패턴 목록
+            
+        Returns:
+            생성된 Chrome 드라이버
+        """
         try:
             chrome_options = Options()
             
@@ -80,87 +271,370 @@ class AIServiceAutomator:
             chrome_options.add_argument("--allow-running-insecure-content")
             chrome_options.add_argument("--disable-web-security")
             
+            # 시작 시 불필요한 백그라운드 작업 줄이기
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-component-update")
+            chrome_options.add_argument("--disable-features=TranslateUI,InterestFeedContentSuggestions")
+            
+            # 쿠키/캐시가 유지되도록 서비스별 영구 프로필 사용
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+            
+            if self.config.webdriver.block_images:
+                chrome_options.add_experimental_option(
+                    "prefs", {"profile.managed_default_content_settings.images": 2}
+                )
+            
             # undetected-chromedriver로 드라이버 생성
-            self.driver = uc.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver = uc.Chrome(options=chrome_options, user_multi_procs=False, no_sandbox=True)
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # 분석/폰트/아바타 등 업로드와 무관한 리소스 차단
+            if blocked_urls:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
             
-            # 대기 시간 설정
-            self.driver.implicitly_wait(self.config.webdriver.implicit_wait)
-            self.wait = WebDriverWait(self.driver, self.config.webdriver.wait_timeout)
+            # 대기 시간 설정 (암묵적 대기는 쓰지 않고 명시적 대기만 사용)
+            driver.set_script_timeout(self.config.webdriver.wait_timeout + 5)
             
             logger.info("AI 서비스용 Chrome 드라이버 설정 완료")
+            return driver
             
         except Exception as e:
             logger.error(f"드라이버 설정 실패: {e}")
             raise
     
-    def _close_driver(self) -> None:
-        """드라이버 종료"""
-        if self.driver:
+    def _force_kill_driver(self, driver: uc.Chrome) -> None:
+        """정상 종료가 지연될 때 chromedriver와 브라우저 프로세스 강제 종료"""
+        logger.warning("Chrome 드라이버 종료 지연, 프로세스를 강제 종료합니다")
+        try:
+            driver.service.process.terminate()
+        except Exception as e:
+            logger.debug(f"chromedriver 프로세스 종료 실패: {e}")
+        
+        # 브라우저가 남아 있으면 프로필 잠금 때문에 다음 실행이 실패하므로 함께 종료
+        browser_pid = getattr(driver, "browser_pid", None)
+        if browser_pid:
             try:
-                self.driver.quit()
-                logger.info("Chrome 드라이버 종료")
-            except Exception as e:
-                logger.error(f"드라이버 종료 실패: {e}")
+                os.kill(browser_pid, signal.SIGTERM)
+            except OSError as e:
+                logger.debug(f"브라우저 프로세스 종료 실패: {e}")
+    
+    def _close_driver(self, driver: uc.Chrome, timeout: float = 2) -> None:
+        """
+        드라이버 종료 (timeout 안에 끝나지 않으면 강제 종료)
+        
+        Args:
+            driver: 종료할 드라이버
+            timeout: 정상 종료 대기 시간(초)
+        """
+        killer = threading.Timer(timeout, self._force_kill_driver, args=(driver,))
+        killer.daemon = True
+        killer.start()
+        
+        try:
+            driver.quit()
+            logger.info("Chrome 드라이버 종료")
+        except Exception as e:
+            logger.error(f"드라이버 종료 실패: {e}")
+        finally:
+            killer.cancel()
+    
+    def _get_driver(self, service: str) -> uc.Chrome:
+        """
+        서비스 전용 드라이버 반환 (처음 필요할 때 생성하고 이후 재사용)
+        
+        Args:
+            service: 서비스 이름
+            
+        Returns:
+            Chrome 드라이버
+        """
+        with self._drivers_lock:
+            driver = self._drivers.get(service)
+        
+        if driver is not None:
+            try:
+                driver.current_url  # 창이 닫혔는지 확인
+                return driver
+            except WebDriverException:
+                logger.warning(f"{service} 드라이버 연결이 끊어져 다시 생성합니다")
+                self._close_driver(driver)
+        
+        service_config = getattr(self.config.ai_services, service)
+        blocked_urls = service_config.get("blocked_urls", DEFAULT_BLOCKED_URLS)
+        driver = self._setup_driver_instance(self._get_service_profile_dir(service), blocked_urls)
+        
+        with self._drivers_lock:
+            self._drivers[service] = driver
+        
+        return driver
+    
+    def close(self) -> None:
+        """열려 있는 모든 서비스 드라이버 종료"""
+        with self._drivers_lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+        
+        for driver in drivers:
+            self._close_driver(driver)
+        
+        self._upload_executor.shutdown(wait=False)
+    
+    def __enter__(self) -> "AIServiceAutomator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _prompt_manual_login(self, service_name: str) -> None:
+        """수동 로그인 안내 (병렬 업로드 중에는 한 번에 하나씩)"""
+        with self._login_prompt_lock:
+            logger.warning(f"{service_name} 로그인이 필요합니다. 수동 로그인 후 진행하세요.")
+            input(f"{service_name}에 로그인한 후 Enter를 눌러주세요...")
+    
+    def _find_element_fast(
+        self,
+        driver: uc.Chrome,
+        locator: Tuple[str, str],
+        timeout: float = 3
+    ) -> WebElement:
+        """
+        짧은 명시적 대기로 요소 찾기 (없으면 빠르게 TimeoutException)
+        
+        숨겨진 파일 입력도 찾을 수 있도록 클릭 가능 여부가 아닌 존재 여부로 판단한다.
+        
+        Args:
+            driver: Chrome 드라이버
+            locator: 찾을 요소 로케이터
+            timeout: 최대 대기 시간(초)
+            
+        Returns:
+            찾은 요소
+        """
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.presence_of_element_located(locator)
+        )
+    
+    def _wait_text_area_ready(self, wait: WebDriverWait, locator: Tuple[str, str]) -> WebElement:
+        """
+        입력 영역이 클릭 가능해질 때까지 대기
+        
+        Args:
+            wait: 드라이버 대기 객체
+            locator: 입력 영역 로케이터
+            
+        Returns:
+            입력 영역 요소
+        """
+        return wait.until(EC.element_to_be_clickable(locator))
+    
+    def _ensure_on(
+        self,
+        driver: uc.Chrome,
+        url: str,
+        new_chat_locator: Optional[Tuple[str, str]] = None
+    ) -> None:
+        """
+        서비스 페이지로 이동 (이미 해당 페이지면 다시 불러오지 않음)
+        
+        Args:
+            driver: Chrome 드라이버
+            url: 서비스 시작 페이지 URL
+            new_chat_locator: 새 대화 링크 (지정하면 이전 대화에서 전체 이동 대신 클릭)
+        """
+        current_url = driver.current_url
+        
+        if current_url.rstrip("/") == url.rstrip("/"):
+            logger.debug(f"이미 서비스 페이지에 있어 이동 생략: {url}")
+        elif not (new_chat_locator and self._click_new_chat(driver, current_url, new_chat_locator)):
+            driver.get(url)
+        
+        WebDriverWait(driver, 5, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    
+    def _click_new_chat(
+        self,
+        driver: uc.Chrome,
+        current_url: str,
+        new_chat_locator: Tuple[str, str]
+    ) -> bool:
+        """
+        이전 대화 페이지에서 새 대화 링크를 눌러 SPA 내부에서 이동
+        
+        Args:
+            driver: Chrome 드라이버
+            current_url: 현재 페이지 URL
+            new_chat_locator: 새 대화 링크
+            
+        Returns:
+            새 대화 화면으로 이동했는지 여부
+        """
+        if not current_url.startswith("http"):
+            return False
+        
+        try:
+            if not driver.execute_script(_CLICK_IF_PRESENT_JS, new_chat_locator[1]):
+                return False
+            
+            WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                lambda d: urlsplit(d.current_url).path in ("", "/")
+            )
+            return True
+        except (TimeoutException, WebDriverException):
+            return False
+    
+    def _wait_for_text_area(
+        self,
+        driver: uc.Chrome,
+        wait: WebDriverWait,
+        service_name: str,
+        locator: Tuple[str, str]
+    ) -> WebElement:
+        """
+        입력 영역 대기 (로그인된 프로필이면 바로 반환, 아니면 수동 로그인 안내)
+        
+        Args:
+            driver: Chrome 드라이버
+            wait: 드라이버 대기 객체
+            service_name: 서비스 표시 이름
+            locator: 입력 영역 로케이터
+            
+        Returns:
+            입력 영역 요소
+        """
+        try:
+            probe = WebDriverWait(driver, 2, poll_frequency=0.1)
+            return self._wait_text_area_ready(probe, locator)
+        except TimeoutException:
+            self._prompt_manual_login(service_name)
+            return self._wait_text_area_ready(wait, locator)
+    
+    def _wait_upload_preview_visible(
+        self,
+        driver: uc.Chrome,
+        wait: WebDriverWait,
+        preview_locator: Tuple[str, str],
+        prev_count: int
+    ) -> int:
+        """
+        첨부 미리보기가 하나 더 나타날 때까지 대기
+        
+        Args:
+            driver: Chrome 드라이버
+            wait: 드라이버 대기 객체
+            preview_locator: 첨부 미리보기 로케이터
+            prev_count: 업로드 전 미리보기 개수
+            
+        Returns:
+            현재 미리보기 개수
+        """
+        try:
+            wait.until(
+                lambda d: len(d.find_elements(*preview_locator)) > prev_count
+            )
+        except TimeoutException:
+            logger.debug(f"첨부 미리보기 확인 실패 (계속 진행): {preview_locator[1]}")
+        
+        return len(driver.find_elements(*preview_locator))
+    
+    def _fast_type(self, driver: uc.Chrome, element: WebElement, text: str) -> None:
+        """
+        입력 영역 내용을 한 번의 CDP 호출로 교체 (글자별 키 이벤트 없이)
+        
+        Args:
+            driver: Chrome 드라이버
+            element: 입력 영역 요소 (textarea 또는 contenteditable)
+            text: 입력할 텍스트
+        """
+        driver.execute_script(_FOCUS_AND_SELECT_JS, element)
+        
+        try:
+            # 포커스된 요소에 실제 입력 이벤트로 삽입되므로 React/ProseMirror 편집기도 인식
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        except WebDriverException as e:
+            logger.debug(f"CDP 입력 실패, 스크립트로 대체: {e}")
+            driver.execute_script(_SET_TEXT_JS, element, text)
+    
+    def _chain_prompt_and_send(
+        self,
+        driver: uc.Chrome,
+        text_area: WebElement,
+        send_selector: Optional[str],
+        prompt: str
+    ) -> None:
+        """
+        프롬프트 입력 후 전송까지 최소한의 호출로 처리
+        
+        Args:
+            driver: Chrome 드라이버
+            text_area: 입력 영역 요소
+            send_selector: 전송 버튼 CSS 선택자 (None이면 Enter 키로 전송)
+            prompt: 입력할 프롬프트
+        """
+        self._fast_type(driver, text_area, prompt)
+        
+        timeout_ms = self.config.webdriver.wait_timeout * 1000
+        if send_selector is None:
+            # 합성 이벤트는 편집기가 무시할 수 있으므로 실제 키 입력으로 전송하고 입력 영역이 비워지는지 확인
+            text_area.send_keys(Keys.ENTER)
+            result = driver.execute_async_script(_WAIT_INPUT_CLEARED_JS, text_area, timeout_ms)
+        else:
+            result = driver.execute_async_script(_SEND_WHEN_READY_JS, send_selector, timeout_ms)
+        
+        if result is not True:
+            raise WebDriverException(f"프롬프트 전송 실패: {result}")
     
-    def _upload_to_chatgpt(self, prompt: str, image_paths: List[str]) -> AIServiceResult:
+    def _upload_to_chatgpt(
+        self,
+        driver: uc.Chrome,
+        wait: WebDriverWait,
+        url: str,
+        prompt: str,
+        image_paths: List[ImageEntry],
+        upload_time: str
+    ) -> AIServiceResult:
         """ChatGPT에 프롬프트와 이미지 업로드"""
         try:
             logger.info("ChatGPT 업로드 시작")
             
-            # ChatGPT 페이지로 이동
-            self.driver.get(self.service_urls["chatgpt"])
-            time.sleep(3)
+            # ChatGPT 페이지로 이동 (이전 대화에서는 새 대화 링크 클릭)
+            self._ensure_on(driver, url, CHATGPT_NEW_CHAT)
             
-            # 로그인 확인 (간단한 체크)
-            try:
-                # 텍스트 입력 영역 찾기
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//textarea[@data-id='root']"))
-                )
-            except TimeoutException:
-                logger.warning("ChatGPT 로그인이 필요합니다. 수동 로그인 후 진행하세요.")
-                input("ChatGPT에 로그인한 후 Enter를 눌러주세요...")
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//textarea[@data-id='root']"))
-                )
+            # 로그인 확인 후 텍스트 입력 영역 찾기
+            text_area = self._wait_for_text_area(driver, wait, "ChatGPT", CHATGPT_TEXTAREA)
             
             # 이미지 업로드 (있는 경우)
             if image_paths:
                 try:
                     # 파일 업로드 버튼 찾기
-                    upload_button = self.driver.find_element(By.XPATH, "//input[@type='file']")
-                    
-                    # 여러 이미지 업로드
-                    for image_path in image_paths:
-                        if os.path.exists(image_path):
-                            upload_button.send_keys(image_path)
-                            time.sleep(2)
-                            logger.info(f"이미지 업로드 완료: {os.path.basename(image_path)}")
-                        else:
-                            logger.warning(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+                    upload_button = self._find_element_fast(driver, FILE_INPUT)
                     
-                    time.sleep(3)  # 이미지 처리 대기
+                    # 여러 이미지 업로드 (미리보기가 늘어나는 것으로 완료 확인)
+                    preview_count = len(driver.find_elements(*CHATGPT_ATTACHMENT))
+                    for image_path, image_name in image_paths:
+                        upload_button.send_keys(image_path)
+                        preview_count = self._wait_upload_preview_visible(
+                            driver, wait, CHATGPT_ATTACHMENT, preview_count
+                        )
+                        logger.info(f"이미지 업로드 완료: {image_name}")
                     
                 except Exception as e:
                     logger.warning(f"이미지 업로드 실패, 텍스트만 전송: {e}")
             
-            # 프롬프트 입력
-            text_area.clear()
-            text_area.send_keys(prompt)
-            time.sleep(1)
-            
-            # 전송 버튼 클릭
-            send_button = self.driver.find_element(By.XPATH, "//button[@data-testid='send-button']")
-            send_button.click()
+            # 프롬프트 입력 및 전송
+            self._chain_prompt_and_send(
+                driver, text_area, CHATGPT_SEND[1], prompt
+            )
             
             logger.info("ChatGPT 업로드 완료")
             return AIServiceResult(
                 service_name="ChatGPT",
                 success=True,
                 message="업로드 성공",
-                upload_time=datetime.now().isoformat(),
-                response_url=self.driver.current_url
+                upload_time=upload_time,
+                response_url=driver.current_url
             )
             
         except Exception as e:
@@ -169,67 +643,54 @@ class AIServiceAutomator:
                 service_name="ChatGPT",
                 success=False,
                 message=f"업로드 실패: {str(e)}",
-                upload_time=datetime.now().isoformat()
+                upload_time=upload_time
             )
     
-    def _upload_to_claude(self, prompt: str, image_paths: List[str]) -> AIServiceResult:
+    def _upload_to_claude(
+        self,
+        driver: uc.Chrome,
+        wait: WebDriverWait,
+        url: str,
+        prompt: str,
+        image_paths: List[ImageEntry],
+        upload_time: str
+    ) -> AIServiceResult:
         """Claude에 프롬프트와 이미지 업로드"""
         try:
             logger.info("Claude 업로드 시작")
             
             # Claude 페이지로 이동
-            self.driver.get(self.service_urls["claude"])
-            time.sleep(3)
+            self._ensure_on(driver, url)
             
-            # 로그인 확인
-            try:
-                # 텍스트 입력 영역 찾기
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//div[@contenteditable='true']"))
-                )
-            except TimeoutException:
-                logger.warning("Claude 로그인이 필요합니다. 수동 로그인 후 진행하세요.")
-                input("Claude에 로그인한 후 Enter를 눌러주세요...")
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//div[@contenteditable='true']"))
-                )
+            # 로그인 확인 후 텍스트 입력 영역 찾기
+            text_area = self._wait_for_text_area(driver, wait, "Claude", CLAUDE_EDITOR)
             
             # 이미지 업로드 (있는 경우)
             if image_paths:
                 try:
-                    # 첨부 버튼 찾기
-                    attach_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Attach')]")
-                    
-                    for image_path in image_paths:
-                        if os.path.exists(image_path):
-                            # 파일 입력 요소 찾기
-                            file_input = self.driver.find_element(By.XPATH, "//input[@type='file']")
-                            file_input.send_keys(image_path)
-                            time.sleep(2)
-                            logger.info(f"이미지 업로드 완료: {os.path.basename(image_path)}")
-                        else:
-                            logger.warning(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-                    
-                    time.sleep(3)  # 이미지 처리 대기
+                    preview_count = len(driver.find_elements(*CLAUDE_ATTACHMENT))
+                    for image_path, image_name in image_paths:
+                        # 파일 입력 요소 찾기
+                        file_input = self._find_element_fast(driver, FILE_INPUT)
+                        file_input.send_keys(image_path)
+                        preview_count = self._wait_upload_preview_visible(
+                            driver, wait, CLAUDE_ATTACHMENT, preview_count
+                        )
+                        logger.info(f"이미지 업로드 완료: {image_name}")
                     
                 except Exception as e:
                     logger.warning(f"이미지 업로드 실패, 텍스트만 전송: {e}")
             
-            # 프롬프트 입력
-            text_area.clear()
-            text_area.send_keys(prompt)
-            time.sleep(1)
-            
-            # 전송 (Enter 키)
-            text_area.send_keys(Keys.ENTER)
+            # 프롬프트 입력 및 전송 (Enter 키)
+            self._chain_prompt_and_send(driver, text_area, None, prompt)
             
             logger.info("Claude 업로드 완료")
             return AIServiceResult(
                 service_name="Claude",
                 success=True,
                 message="업로드 성공",
-                upload_time=datetime.now().isoformat(),
-                response_url=self.driver.current_url
+                upload_time=upload_time,
+                response_url=driver.current_url
             )
             
         except Exception as e:
@@ -238,71 +699,59 @@ class AIServiceAutomator:
                 service_name="Claude",
                 success=False,
                 message=f"업로드 실패: {str(e)}",
-                upload_time=datetime.now().isoformat()
+                upload_time=upload_time
             )
     
-    def _upload_to_gemini(self, prompt: str, image_paths: List[str]) -> AIServiceResult:
+    def _upload_to_gemini(
+        self,
+        driver: uc.Chrome,
+        wait: WebDriverWait,
+        url: str,
+        prompt: str,
+        image_paths: List[ImageEntry],
+        upload_time: str
+    ) -> AIServiceResult:
         """Gemini에 프롬프트와 이미지 업로드"""
         try:
             logger.info("Gemini 업로드 시작")
             
             # Gemini 페이지로 이동
-            self.driver.get(self.service_urls["gemini"])
-            time.sleep(3)
+            self._ensure_on(driver, url)
             
-            # 로그인 확인
-            try:
-                # 텍스트 입력 영역 찾기
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//textarea"))
-                )
-            except TimeoutException:
-                logger.warning("Gemini 로그인이 필요합니다. 수동 로그인 후 진행하세요.")
-                input("Gemini에 로그인한 후 Enter를 눌러주세요...")
-                text_area = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//textarea"))
-                )
+            # 로그인 확인 후 텍스트 입력 영역 찾기
+            text_area = self._wait_for_text_area(driver, wait, "Gemini", GEMINI_TEXTAREA)
             
             # 이미지 업로드 (있는 경우)
             if image_paths:
                 try:
                     # 이미지 업로드 버튼 찾기
-                    upload_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Upload')]")
+                    upload_button = self._find_element_fast(driver, GEMINI_UPLOAD)
                     
-                    for image_path in image_paths:
-                        if os.path.exists(image_path):
-                            upload_button.click()
-                            time.sleep(1)
-                            
-                            # 파일 선택
-                            file_input = self.driver.find_element(By.XPATH, "//input[@type='file']")
-                            file_input.send_keys(image_path)
-                            time.sleep(2)
-                            logger.info(f"이미지 업로드 완료: {os.path.basename(image_path)}")
-                        else:
-                            logger.warning(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-                    
-                    time.sleep(3)  # 이미지 처리 대기
+                    preview_count = len(driver.find_elements(*GEMINI_ATTACHMENT))
+                    for image_path, image_name in image_paths:
+                        upload_button.click()
+                        
+                        # 파일 선택
+                        file_input = self._find_element_fast(driver, FILE_INPUT)
+                        file_input.send_keys(image_path)
+                        preview_count = self._wait_upload_preview_visible(
+                            driver, wait, GEMINI_ATTACHMENT, preview_count
+                        )
+                        logger.info(f"이미지 업로드 완료: {image_name}")
                     
                 except Exception as e:
                     logger.warning(f"이미지 업로드 실패, 텍스트만 전송: {e}")
             
-            # 프롬프트 입력
-            text_area.clear()
-            text_area.send_keys(prompt)
-            time.sleep(1)
-            
-            # 전송 버튼 클릭
-            send_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Send')]")
-            send_button.click()
+            # 프롬프트 입력 및 전송
+            self._chain_prompt_and_send(driver, text_area, GEMINI_SEND[1], prompt)
             
             logger.info("Gemini 업로드 완료")
             return AIServiceResult(
                 service_name="Gemini",
                 success=True,
                 message="업로드 성공",
-                upload_time=datetime.now().isoformat(),
-                response_url=self.driver.current_url
+                upload_time=upload_time,
+                response_url=driver.current_url
             )
             
         except Exception as e:
@@ -311,98 +760,178 @@ class AIServiceAutomator:
                 service_name="Gemini",
                 success=False,
                 message=f"업로드 실패: {str(e)}",
-                upload_time=datetime.now().isoformat()
+                upload_time=upload_time
             )
     
+    # 서비스 이름 → 업로드 핸들러 (config 순서대로 self.services 구성에 사용)
+    SERVICE_HANDLERS: Dict[str, Callable[..., AIServiceResult]] = {
+        "chatgpt": _upload_to_chatgpt,
+        "claude": _upload_to_claude,
+        "gemini": _upload_to_gemini,
+    }
+    
     def upload_to_ai_services(
         self, 
         prompt: str, 
-        image_paths: Optional[List[str]] = None,
+        image_paths: Optional[List[ImageEntry]] = None,
         services: Optional[List[str]] = None
     ) -> List[AIServiceResult]:
         """
-        선택된 AI 서비스들에 프롬프트와 이미지 업로드
+        선택된 AI 서비스들에 프롬프트와 이미지 업로드 (동기 호출용 래퍼)
         
         Args:
             prompt: 업로드할 프롬프트
-            image_paths: 업로드할 이미지 파일 경로 리스트
+            image_paths: 업로드할 이미지 (경로, 파일명) 리스트
             services: 업로드할 서비스 리스트 (None이면 활성화된 모든 서비스)
             
         Returns:
             각 서비스별 업로드 결과
         """
+        return asyncio.run(self.upload_to_ai_services_async(prompt, image_paths, services))
+    
+    async def upload_to_ai_services_async(
+        self, 
+        prompt: str, 
+        image_paths: Optional[List[ImageEntry]] = None,
+        services: Optional[List[str]] = None
+    ) -> List[AIServiceResult]:
+        """
+        선택된 AI 서비스들에 프롬프트와 이미지를 동시에 업로드
+        
+        Args:
+            prompt: 업로드할 프롬프트
+            image_paths: 업로드할 이미지 (경로, 파일명) 리스트
+            services: 업로드할 서비스 리스트 (None이면 활성화된 모든 서비스)
+            
+        Returns:
+            각 서비스별 업로드 결과 (요청한 서비스 순서)
+        """
         if image_paths is None:
             image_paths = []
         
         if services is None:
-            services = [service for service, enabled in self.enabled_services.items() if enabled]
+            selected_services = self._default_services
+        else:
+            selected_services = self._select_services(services)
         
-        results = []
+        if not selected_services:
+            return []
         
-        try:
-            # 드라이버 설정
-            self._setup_driver()
-            
-            for service in services:
-                if service not in self.service_urls:
-                    logger.warning(f"지원하지 않는 서비스: {service}")
-                    continue
-                
-                if not self.enabled_services.get(service, False):
-                    logger.info(f"비활성화된 서비스 건너뜀: {service}")
-                    continue
-                
-                logger.info(f"{service} 업로드 시작")
-                
-                try:
-                    if service == "chatgpt":
-                        result = self._upload_to_chatgpt(prompt, image_paths)
-                    elif service == "claude":
-                        result = self._upload_to_claude(prompt, image_paths)
-                    elif service == "gemini":
-                        result = self._upload_to_gemini(prompt, image_paths)
-                    else:
-                        result = AIServiceResult(
-                            service_name=service,
-                            success=False,
-                            message="지원하지 않는 서비스",
-                            upload_time=datetime.now().isoformat()
-                        )
-                    
-                    results.append(result)
-                    
-                    if result.success:
-                        logger.info(f"{service} 업로드 성공")
-                    else:
-                        logger.error(f"{service} 업로드 실패: {result.message}")
-                    
-                    # 서비스 간 대기 시간
-                    time.sleep(3)
-                    
-                except Exception as e:
-                    logger.error(f"{service} 업로드 중 오류: {e}")
-                    results.append(AIServiceResult(
-                        service_name=service,
-                        success=False,
-                        message=f"업로드 중 오류: {str(e)}",
-                        upload_time=datetime.now().isoformat()
-                    ))
+        # 같은 묶음의 결과는 모두 같은 업로드 시각을 사용
+        upload_time = datetime.now().isoformat(timespec='seconds')
+        
+        # 서비스별 드라이버를 작업 스레드에서 동시에 실행 (gather는 요청 순서대로 결과를 돌려줌)
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._upload_executor,
+                self._run_service_upload, spec, prompt, image_paths, upload_time
+            )
+            for spec in selected_services
+        ), return_exceptions=True)
+        
+        results = [
+            self._finish_service_upload(spec, outcome, upload_time)
+            for spec, outcome in zip(selected_services, outcomes)
+        ]
+        
+        logger.info(f"AI 서비스 업로드 완료: {len([r for r in results if r.success])}/{len(results)} 성공")
+        
+        return results
+    
+    def _select_services(self, services: List[str]) -> Tuple[_ServiceSpec, ...]:
+        """
+        요청한 서비스 이름을 요청 순서대로 서비스 설정으로 변환
+        
+        Args:
+            services: 업로드할 서비스 이름 리스트
             
-            logger.info(f"AI 서비스 업로드 완료: {len([r for r in results if r.success])}/{len(results)} 성공")
+        Returns:
+            업로드할 서비스 설정 (지원하지 않거나 비활성화된 서비스, 중복 이름은 제외)
+        """
+        selected: Dict[str, _ServiceSpec] = {}
+        
+        for service in services:
+            spec = self._services_by_name.get(service)
+            if spec is None:
+                logger.warning(f"지원하지 않는 서비스: {service}")
+                continue
             
-        except Exception as e:
-            logger.error(f"AI 서비스 업로드 전체 실패: {e}")
+            if not spec.enabled:
+                logger.warning(f"비활성화된 서비스 건너뜀: {service}")
+                continue
             
-        finally:
-            self._close_driver()
+            # 같은 서비스 드라이버를 두 스레드에서 동시에 쓰지 않도록 중복 요청은 한 번만 실행
+            selected.setdefault(service, spec)
         
-        return results
+        return tuple(selected.values())
+    
+    def _finish_service_upload(
+        self,
+        spec: _ServiceSpec,
+        outcome: object,
+        upload_time: str
+    ) -> AIServiceResult:
+        """
+        단일 서비스 업로드 결과를 기록하고 예외를 실패 결과로 변환
+        
+        Args:
+            spec: 서비스 설정
+            outcome: 업로드 결과 또는 작업 스레드에서 발생한 예외
+            upload_time: 이번 업로드 묶음의 시각 (ISO 형식)
+            
+        Returns:
+            업로드 결과
+        """
+        if isinstance(outcome, BaseException):
+            logger.error(f"{spec.name} 업로드 중 오류: {outcome}")
+            result = AIServiceResult(
+                service_name=spec.name,
+                success=False,
+                message=f"업로드 중 오류: {str(outcome)}",
+                upload_time=upload_time
+            )
+        else:
+            result = outcome
+        
+        if result.success:
+            logger.info(f"{spec.name} 업로드 성공")
+        else:
+            logger.error(f"{spec.name} 업로드 실패: {result.message}")
+        
+        return result
+    
+    def _run_service_upload(
+        self,
+        spec: _ServiceSpec,
+        prompt: str,
+        image_paths: List[ImageEntry],
+        upload_time: str
+    ) -> AIServiceResult:
+        """
+        독립 드라이버로 단일 서비스 업로드 실행 (작업 스레드에서 호출)
+        
+        Args:
+            spec: 서비스 설정
+            prompt: 업로드할 프롬프트
+            image_paths: 업로드할 이미지 (경로, 파일명) 리스트
+            upload_time: 이번 업로드 묶음의 시각 (ISO 형식)
+            
+        Returns:
+            업로드 결과
+        """
+        logger.info(f"{spec.name} 업로드 시작")
+        
+        driver = self._get_driver(spec.name)
+        wait = WebDriverWait(driver, self.config.webdriver.wait_timeout, poll_frequency=0.1)
+        
+        return spec.handler(self, driver, wait, spec.url, prompt, image_paths, upload_time)
     
     def prepare_stock_data_for_upload(
         self, 
         stock_data: StockData, 
         prompt_template: str
-    ) -> Tuple[str, List[str]]:
+    ) -> Tuple[str, List[ImageEntry]]:
         """
         주식 데이터를 AI 서비스 업로드용으로 준비
         
@@ -411,35 +940,63 @@ class AIServiceAutomator:
             prompt_template: 프롬프트 템플릿
             
         Returns:
-            (최종 프롬프트, 이미지 경로 리스트)
+            (최종 프롬프트, (이미지 경로, 파일명) 리스트)
         """
         # 프롬프트에 주식 정보 추가
-        stock_info = f"""
-📊 주식 정보
-• 종목명: {stock_data.stock_name} ({stock_data.stock_code})
-• 현재가: {stock_data.current_price}
-• 등락: {stock_data.price_change} ({stock_data.change_rate})
-• 거래량: {stock_data.volume}
-
-📈 최근 뉴스 (상위 3개):
-"""
+        parts = [
+            "",
+            "📊 주식 정보",
+            f"• 종목명: {stock_data.stock_name} ({stock_data.stock_code})",
+            f"• 현재가: {stock_data.current_price}",
+            f"• 등락: {stock_data.price_change} ({stock_data.change_rate})",
+            f"• 거래량: {stock_data.volume}",
+            "",
+            "📈 최근 뉴스 (상위 3개):",
+        ]
         
         # 주요 뉴스 추가
-        for i, news in enumerate(stock_data.news_data[:3], 1):
-            stock_info += f"{i}. {news['title']} ({news['date']})\n"
+        parts.extend(
+            f"{i}. {news.title} ({news.date})"
+            for i, news in enumerate(stock_data.news_data[:3], 1)
+        )
         
         # 관련 테마 추가
         if stock_data.related_themes:
-            stock_info += f"\n🏷️ 관련 테마: {', '.join(stock_data.related_themes[:5])}\n"
+            parts.append("")
+            parts.append(f"🏷️ 관련 테마: {', '.join(stock_data.related_themes[:5])}")
+        
+        stock_info = "\n".join(parts) + "\n"
         
         # 최종 프롬프트 구성
         final_prompt = f"{stock_info}\n\n{prompt_template}"
         
-        # 이미지 경로 수집
-        image_paths = []
-        for chart_type, path in stock_data.chart_screenshots.items():
-            if os.path.exists(path):
-                image_paths.append(path)
+        # 존재하는 이미지만 한 번 확인 (업로드 단계에서는 다시 확인하지 않음)
+        candidate_paths = list(stock_data.chart_screenshots.values())
+        if len(candidate_paths) > 4:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                exists = list(executor.map(os.path.isfile, candidate_paths))
+        else:
+            exists = [os.path.isfile(path) for path in candidate_paths]
+        
+        # 이미지 경로 수집 (내용이 같은 이미지는 첫 번째만 사용)
+        image_paths: List[ImageEntry] = []
+        seen_hashes: Set[str] = set()
+        for path, is_file in zip(candidate_paths, exists):
+            if not is_file:
+                logger.warning(f"이미지 파일을 찾을 수 없습니다: {path}")
+                continue
+            
+            digest = self._get_image_hash(path)
+            name = os.path.basename(path)
+            
+            if digest in seen_hashes:
+                logger.debug(f"중복 이미지 제외: {name}")
+                continue
+            
+            seen_hashes.add(digest)
+            image_paths.append((path, name))
+        
+        self._save_upload_hashes()
         
         return final_prompt, image_paths
     
@@ -485,19 +1042,22 @@ class AIServiceAutomator:
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
         
-        summary = f"\n📊 업로드 결과 요약:\n"
-        summary += f"• 전체: {len(results)}개 서비스\n"
-        summary += f"• 성공: {len(successful)}개\n"
-        summary += f"• 실패: {len(failed)}개\n\n"
+        lines = [
+            "",
+            "📊 업로드 결과 요약:",
+            f"• 전체: {len(results)}개 서비스",
+            f"• 성공: {len(successful)}개",
+            f"• 실패: {len(failed)}개",
+            "",
+        ]
         
         if successful:
-            summary += "✅ 성공한 서비스:\n"
-            for result in successful:
-                summary += f"  - {result.service_name}: {result.message}\n"
+            lines.append("✅ 성공한 서비스:")
+            lines.extend(f"  - {result.service_name}: {result.message}" for result in successful)
         
         if failed:
-            summary += "\n❌ 실패한 서비스:\n"
-            for result in failed:
-                summary += f"  - {result.service_name}: {result.message}\n"
+            lines.append("")
+            lines.append("❌ 실패한 서비스:")
+            lines.extend(f"  - {result.service_name}: {result.message}" for result in failed)
         
-        return summary
\ No newline at end of file
+        return "\n".join(lines) + "\n"
\ No newline at end of file
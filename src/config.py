@@ -3,12 +3,43 @@
 """
 
 import os
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# AI 서비스 페이지에서 기본으로 차단할 URL 패턴 (CDP Network.setBlockedURLs)
+# 서비스별로 ai_services.<service>.blocked_urls 를 지정하면 이 목록 대신 사용된다.
+DEFAULT_BLOCKED_URLS = [
+    "*.googletagmanager.com/*",
+    "*.google-analytics.com/*",
+    "*.segment.io/*",
+    "*.sentry.io/*",
+    "*/fonts/*.woff*",
+    "*/avatars/*",
+]
+
+# 네이버 증권 종목 탭별 경로 (base_url 기준, {code}에 종목 코드)
+# 탭 버튼을 찾아 클릭하지 않고 탭 주소로 바로 이동할 때 사용한다.
+NAVER_TAB_PATHS = {
+    "main": "/item/main.naver?code={code}",
+    "analysis": "/item/coinfo.naver?code={code}",
+    "opinion": "/item/coinfo.naver?code={code}&target=invest",
+    "financial": "/item/coinfo.naver?code={code}&target=finsum_more",
+    "news": "/item/news.naver?code={code}",
+    "discussion": "/item/board.naver?code={code}",
+    "investor": "/item/frgn.naver?code={code}",
+    "chart": "/item/fchart.naver?code={code}",
+}
+
 
 @dataclass
 class WebDriverConfig:
@@ -17,7 +48,9 @@ class WebDriverConfig:
     window_size: str = "1920,1080"
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     wait_timeout: int = 10
-    implicit_wait: int = 3
+    profile_dir: str = "~/.cache/magicsplitgpt/chrome-profile"
+    block_images: bool = False
+    lean_mode: bool = True  # 수집용 Chrome의 백그라운드 기능(번역, 동기화, 확장 등) 끄기
 
 
 @dataclass
@@ -26,6 +59,7 @@ class NaverFinanceConfig:
     base_url: str = "https://finance.naver.com"
     stock_url: str = "https://finance.naver.com/item/main.naver"
     delay_between_requests: int = 2
+    cache_ttl_seconds: int = 0  # 같은 종목을 다시 수집하지 않는 시간 (0이면 캐시 사용 안 함, 기본값)
 
 
 @dataclass
@@ -34,11 +68,20 @@ class ScreenshotConfig:
     save_path: str = "screenshots"
     format: str = "png"
     quality: int = 95
+    optimize_for_speed: bool = True  # CDP 캡처 시 인코딩 속도 우선 (jpeg/webp에서 효과 큼)
+    fallback_format: str = "jpeg"  # 백업용·요소 캡처 실패 시 전체 화면 캡처 형식
+    fallback_quality: int = 80
 
 
 @dataclass
 class AIServiceConfig:
-    """AI 서비스 설정"""
+    """
+    AI 서비스 설정
+    
+    서비스별 키: url, enabled, blocked_urls(선택, 차단할 URL 패턴 목록).
+    blocked_urls를 생략하면 DEFAULT_BLOCKED_URLS를 사용하고, 빈 목록이면 차단하지 않는다.
+    업로드 엔드포인트가 기본 패턴에 걸리는 서비스(예: Gemini)는 필요한 패턴만 남겨 지정한다.
+    """
     chatgpt: Dict[str, Any] = None
     claude: Dict[str, Any] = None
     gemini: Dict[str, Any] = None
@@ -88,6 +131,24 @@ class LoggingConfig:
     retention: str = "7 days"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    YAML 파일 파싱 (경로 + 수정시각 기준 캐시)
+    
+    반환된 딕셔너리는 여러 Config 인스턴스가 공유하므로 수정하지 않는다.
+    
+    Args:
+        path: 설정 파일 경로
+        mtime: 파일 수정 시각 (파일이 바뀌면 캐시 키가 달라짐)
+        
+    Returns:
+        파싱된 설정 데이터
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=SafeLoader) or {}
+
+
 class Config:
     """통합 설정 관리 클래스"""
     
@@ -118,10 +179,10 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         """설정 파일 로드"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
-                logger.info(f"설정 파일 로드 완료: {self.config_path}")
-                return config_data
+            mtime = os.path.getmtime(self.config_path)
+            config_data = _load_yaml(self.config_path, mtime)
+            logger.info(f"설정 파일 로드 완료: {self.config_path}")
+            return config_data
         except FileNotFoundError:
             logger.warning(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
             return {}
@@ -139,7 +200,11 @@ class Config:
             window_size=chrome_config.get("window_size", "1920,1080"),
             user_agent=chrome_config.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
             wait_timeout=config.get("wait_timeout", 10),
-            implicit_wait=config.get("implicit_wait", 3)
+            profile_dir=os.path.expanduser(
+                chrome_config.get("profile_dir", "~/.cache/magicsplitgpt/chrome-profile")
+            ),
+            block_images=chrome_config.get("block_images", False),
+            lean_mode=chrome_config.get("lean_mode", True)
         )
     
     def _create_naver_finance_config(self) -> NaverFinanceConfig:
@@ -149,7 +214,8 @@ class Config:
         return NaverFinanceConfig(
             base_url=config.get("base_url", "https://finance.naver.com"),
             stock_url=config.get("stock_url", "https://finance.naver.com/item/main.naver"),
-            delay_between_requests=config.get("delay_between_requests", 2)
+            delay_between_requests=config.get("delay_between_requests", 2),
+            cache_ttl_seconds=config.get("cache_ttl_seconds", 0)
         )
     
     def _create_screenshot_config(self) -> ScreenshotConfig:
@@ -159,7 +225,10 @@ class Config:
         return ScreenshotConfig(
             save_path=config.get("save_path", "screenshots"),
             format=config.get("format", "png"),
-            quality=config.get("quality", 95)
+            quality=config.get("quality", 95),
+            optimize_for_speed=config.get("optimize_for_speed", True),
+            fallback_format=config.get("fallback_format", "jpeg"),
+            fallback_quality=config.get("fallback_quality", 80)
         )
     
     def _create_ai_services_config(self) -> AIServiceConfig:
@@ -215,7 +284,8 @@ class Config:
         directories = [
             self.screenshot.save_path,
             os.path.dirname(self.logging.file_path),
-            self.prompts.templates_path
+            self.prompts.templates_path,
+            self.webdriver.profile_dir
         ]
         
         for directory in directories:
@@ -226,11 +296,37 @@ class Config:
         """주식 코드로 URL 생성"""
         return f"{self.naver_finance.stock_url}?code={stock_code}"
     
+    def get_tab_url(self, stock_code: str, tab: str) -> str:
+        """
+        종목 탭 URL 생성
+        
+        Args:
+            stock_code: 주식 코드
+            tab: NAVER_TAB_PATHS의 탭 이름 (예: "news", "financial")
+            
+        Returns:
+            탭 페이지 URL
+        """
+        return self.naver_finance.base_url + NAVER_TAB_PATHS[tab].format(code=stock_code)
+    
     def reload_config(self) -> None:
         """설정 파일 다시 로드"""
         self._config_data = self._load_config()
         logger.info("설정이 다시 로드되었습니다")
 
 
-# 전역 설정 인스턴스
-config = Config()
\ No newline at end of file
+# 전역 설정 인스턴스 (최초 사용 시 생성)
+_default_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """
+    전역 설정 인스턴스 반환
+    
+    Returns:
+        기본 경로의 설정 파일로 만든 Config 객체
+    """
+    global _default_config
+    if _default_config is None:
+        _default_config = Config()
+    return _default_config
\ No newline at end of file
@@ -4,17 +4,22 @@ MagicSplitGPT 메인 실행 프로그램
 
 import sys
 import time
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 from loguru import logger
 
-from .config import Config
+from .config import Config, get_config
 from .prompt_manager import PromptManager
-from .stock_data_collector import StockDataCollector, StockData
-from .ai_service_automator import AIServiceAutomator
-from .strategy_selector import StrategySelector, StrategyChoice
+
+# Selenium 등 무거운 의존성을 가져오는 모듈은 _initialize_components에서 import
+if TYPE_CHECKING:
+    from .stock_data_collector import StockDataCollector
+    from .ai_service_automator import AIServiceAutomator
+    from .strategy_selector import StrategySelector, StrategyChoice
 
 
 class MagicSplitGPT:
@@ -24,9 +29,13 @@ class MagicSplitGPT:
         """메인 클래스 초기화"""
         self.config: Optional[Config] = None
         self.prompt_manager: Optional[PromptManager] = None
-        self.stock_collector: Optional[StockDataCollector] = None
-        self.ai_automator: Optional[AIServiceAutomator] = None
-        self.strategy_selector: Optional[StrategySelector] = None
+        self.stock_collector: Optional["StockDataCollector"] = None
+        self.ai_automator: Optional["AIServiceAutomator"] = None
+        self.strategy_selector: Optional["StrategySelector"] = None
+        self._enabled_services_str = ""
+        
+        # 데이터 JSON 저장과 업로드 준비는 사용자 확인을 기다리는 동안 백그라운드에서 처리
+        self._background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
         
         self._setup_logging()
         self._initialize_components()
@@ -37,13 +46,21 @@ class MagicSplitGPT:
             # 기본 로그 설정
             logger.remove()  # 기본 핸들러 제거
             
-            # 콘솔 출력 설정
-            logger.add(
-                sys.stdout,
-                level="INFO",
-                format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-                colorize=True
-            )
+            # 콘솔 출력 설정 (터미널이 아니면 색상 태그 없는 형식 사용)
+            if sys.stdout.isatty():
+                logger.add(
+                    sys.stdout,
+                    level="INFO",
+                    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+                    colorize=True
+                )
+            else:
+                logger.add(
+                    sys.stdout,
+                    level="INFO",
+                    format="{time:HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
+                    colorize=False
+                )
             
             # 설정이 로드되면 파일 로깅도 설정
             logger.info("로깅 시스템 초기화 완료")
@@ -58,9 +75,18 @@ class MagicSplitGPT:
             logger.info("MagicSplitGPT 컴포넌트 초기화 시작")
             
             # 설정 로드
-            self.config = Config()
+            self.config = get_config()
             logger.info("설정 로드 완료")
             
+            # 활성화된 AI 서비스 이름 (시작 메시지용)
+            self._enabled_services_str = ", ".join(
+                name for name, enabled in (
+                    ("ChatGPT", self.config.ai_services.chatgpt["enabled"]),
+                    ("Claude", self.config.ai_services.claude["enabled"]),
+                    ("Gemini", self.config.ai_services.gemini["enabled"])
+                ) if enabled
+            )
+            
             # 파일 로깅 설정 (설정 로드 후)
             log_file = Path(self.config.logging.file_path)
             log_file.parent.mkdir(exist_ok=True)
@@ -71,7 +97,8 @@ class MagicSplitGPT:
                 format=self.config.logging.format,
                 rotation=self.config.logging.rotation,
                 retention=self.config.logging.retention,
-                encoding="utf-8"
+                encoding="utf-8",
+                enqueue=True  # 파일 쓰기는 백그라운드 스레드에서 처리
             )
             logger.info(f"파일 로깅 설정 완료: {log_file}")
             
@@ -93,14 +120,17 @@ class MagicSplitGPT:
                 logger.info("모든 프롬프트 템플릿 유효성 검사 통과")
             
             # 주식 데이터 수집기 초기화
+            from .stock_data_collector import StockDataCollector
             self.stock_collector = StockDataCollector(self.config)
             logger.info("주식 데이터 수집기 초기화 완료")
             
             # AI 서비스 자동화 초기화
+            from .ai_service_automator import AIServiceAutomator
             self.ai_automator = AIServiceAutomator(self.config)
             logger.info("AI 서비스 자동화 초기화 완료")
             
             # 전략 선택기 초기화
+            from .strategy_selector import StrategySelector
             self.strategy_selector = StrategySelector(self.config, self.prompt_manager)
             logger.info("전략 선택기 초기화 완료")
             
@@ -110,42 +140,52 @@ class MagicSplitGPT:
             logger.error(f"컴포넌트 초기화 실패: {e}")
             sys.exit(1)
     
+    def _write_lines(self, lines: List[str]) -> None:
+        """
+        여러 줄을 한 번의 쓰기로 출력
+        
+        Args:
+            lines: 출력할 줄 리스트
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
     def _print_welcome_message(self) -> None:
         """시작 메시지 출력"""
-        print("=" * 80)
-        print("🚀 MagicSplitGPT - 주식 분석 자동화 프로그램")
-        print("📊 박성현 작가의 매직스플릿 전략 기반 AI 분석 시스템")
-        print("=" * 80)
-        print()
-        print("💡 주요 기능:")
-        print("• 네이버 증권에서 종목 데이터 자동 수집")
-        print("• 5가지 전문 분석 전략 제공")
-        print("• ChatGPT, Claude, Gemini 자동 업로드")
-        print("• 차트 이미지와 함께 종합 분석")
-        print()
-        print("🎯 매직스플릿 시스템:")
-        print("• 변동성 기반 자동 매매 시스템")
-        print("• 15% 하락시 추가매수, 15% 상승시 익절")
-        print("• 급등락 종목에서 최고 수익률 실현")
-        print()
-        
-        # 컴포넌트 상태 확인
-        enabled_services = [
-            service for service, config in {
-                "ChatGPT": self.config.ai_services.chatgpt["enabled"],
-                "Claude": self.config.ai_services.claude["enabled"], 
-                "Gemini": self.config.ai_services.gemini["enabled"]
-            }.items() if config
-        ]
-        
-        print(f"🤖 활성화된 AI 서비스: {', '.join(enabled_services)}")
-        print(f"📋 사용 가능한 전략: {len(self.strategy_selector.available_strategies)}개")
-        print()
+        self._write_lines([
+            "=" * 80,
+            "🚀 MagicSplitGPT - 주식 분석 자동화 프로그램",
+            "📊 박성현 작가의 매직스플릿 전략 기반 AI 분석 시스템",
+            "=" * 80,
+            "",
+            "💡 주요 기능:",
+            "• 네이버 증권에서 종목 데이터 자동 수집",
+            "• 5가지 전문 분석 전략 제공",
+            "• ChatGPT, Claude, Gemini 자동 업로드",
+            "• 차트 이미지와 함께 종합 분석",
+            "",
+            "🎯 매직스플릿 시스템:",
+            "• 변동성 기반 자동 매매 시스템",
+            "• 15% 하락시 추가매수, 15% 상승시 익절",
+            "• 급등락 종목에서 최고 수익률 실현",
+            "",
+            # 컴포넌트 상태 확인
+            f"🤖 활성화된 AI 서비스: {self._enabled_services_str}",
+            f"📋 사용 가능한 전략: {len(self.strategy_selector.available_strategies)}개",
+            "",
+        ])
+    
+    def _log_save_result(self, future: Future) -> None:
+        """백그라운드 JSON 저장 결과 기록"""
+        try:
+            logger.debug(f"데이터 저장: {future.result()}")
+        except Exception as e:
+            logger.warning(f"JSON 저장 실패: {e}")
     
     def _process_stock_analysis(
         self, 
         stock_code: str, 
-        strategy_choice: StrategyChoice
+        strategy_choice: "StrategyChoice"
     ) -> bool:
         """
         주식 분석 프로세스 실행
@@ -161,10 +201,12 @@ class MagicSplitGPT:
             logger.info(f"주식 분석 프로세스 시작: {stock_code}, 전략: {strategy_choice.strategy_name}")
             
             # 1단계: 주식 데이터 수집
-            print(f"\n🔍 1단계: {stock_code} 데이터 수집 중...")
-            print("• 네이버 증권 접속")
-            print("• 기본 정보, 뉴스, 토론실, 차트 수집")
-            print("• 예상 소요시간: 2-3분")
+            self._write_lines([
+                f"\n🔍 1단계: {stock_code} 데이터 수집 중...",
+                "• 네이버 증권 접속",
+                "• 기본 정보, 뉴스, 토론실, 차트 수집",
+                "• 예상 소요시간: 2-3분",
+            ])
             
             stock_data = self.stock_collector.collect_stock_data(stock_code)
             
@@ -173,36 +215,38 @@ class MagicSplitGPT:
                 logger.error(f"주식 데이터 수집 실패: {stock_code}")
                 return False
             
-            print(f"✅ 데이터 수집 완료: {stock_data.stock_name}")
-            print(f"   현재가: {stock_data.current_price} ({stock_data.change_rate})")
-            print(f"   수집된 뉴스: {len(stock_data.news_data)}개")
-            print(f"   차트 이미지: {len(stock_data.chart_screenshots)}개")
+            self._write_lines([
+                f"✅ 데이터 수집 완료: {stock_data.stock_name}",
+                f"   현재가: {stock_data.current_price} ({stock_data.change_rate})",
+                f"   수집된 뉴스: {len(stock_data.news_data)}개",
+                f"   차트 이미지: {len(stock_data.chart_screenshots)}개",
+            ])
             
-            # 수집된 데이터 JSON 저장
-            try:
-                json_path = self.stock_collector.save_data_to_json(stock_data)
-                print(f"   데이터 저장: {json_path}")
-            except Exception as e:
-                logger.warning(f"JSON 저장 실패: {e}")
+            # 수집된 데이터를 날짜별 JSONL 로그에 추가 (백그라운드, 결과는 로그로 확인)
+            save_future = self._background_executor.submit(self.stock_collector.append_data_to_jsonl, stock_data)
+            save_future.add_done_callback(self._log_save_result)
             
             # 2단계: AI 서비스 업로드 준비
-            print(f"\n🤖 2단계: AI 분석 준비 중...")
-            print(f"• 선택된 전략: {strategy_choice.strategy_description}")
-            print("• 프롬프트와 이미지 준비")
-            
-            final_prompt, image_paths = self.ai_automator.prepare_stock_data_for_upload(
+            self._write_lines([
+                "\n🤖 2단계: AI 분석 준비 중...",
+                f"• 선택된 전략: {strategy_choice.strategy_description}",
+                "• 프롬프트와 이미지 준비",
+            ])
+            
+            # 사용자 확인을 기다리는 동안 프롬프트/이미지 준비
+            prepare_future = self._background_executor.submit(
+                self.ai_automator.prepare_stock_data_for_upload,
                 stock_data, 
                 strategy_choice.template_content
             )
             
-            print(f"   프롬프트 길이: {len(final_prompt)} 문자")
-            print(f"   첨부 이미지: {len(image_paths)}개")
-            
             # 3단계: AI 서비스 업로드
-            print(f"\n🚀 3단계: AI 서비스 업로드 중...")
-            print("• ChatGPT, Claude, Gemini 순차 업로드")
-            print("• 예상 소요시간: 1-2분")
-            print("\n⚠️  주의: 각 AI 서비스에 로그인이 되어있는지 확인하세요!")
+            self._write_lines([
+                "\n🚀 3단계: AI 서비스 업로드 중...",
+                "• ChatGPT, Claude, Gemini 동시 업로드",
+                "• 예상 소요시간: 1분 내외",
+                "\n⚠️  주의: 각 AI 서비스에 로그인이 되어있는지 확인하세요!",
+            ])
             
             # 사용자 확인
             try:
@@ -214,36 +258,37 @@ class MagicSplitGPT:
                 print("\n\n👋 프로그램을 종료합니다.")
                 return False
             
-            # AI 서비스 업로드 실행
-            upload_results = self.ai_automator.upload_to_ai_services(
+            final_prompt, image_paths = prepare_future.result()
+            self._write_lines([
+                f"   프롬프트 길이: {len(final_prompt)} 문자",
+                f"   첨부 이미지: {len(image_paths)}개",
+            ])
+            
+            # AI 서비스 업로드 실행 (서비스별로 동시에 진행)
+            upload_results = asyncio.run(self.ai_automator.upload_to_ai_services_async(
                 prompt=final_prompt,
                 image_paths=image_paths
-            )
+            ))
             
             # 4단계: 결과 요약
-            print(f"\n📊 4단계: 업로드 결과")
             summary = self.ai_automator.get_upload_summary(upload_results)
-            print(summary)
+            self._write_lines(["\n📊 4단계: 업로드 결과", summary])
             
             # 성공한 서비스가 있는지 확인
-            successful_uploads = [r for r in upload_results if r.success]
+            has_success = any(r.success for r in upload_results)
             
-            # AI 업로드 완료 후 드라이버 종료
-            try:
-                self.stock_collector.close_driver_if_needed()
-                logger.info("브라우저 드라이버 정상 종료")
-            except Exception as e:
-                logger.warning(f"드라이버 종료 중 오류: {e}")
-            
-            if successful_uploads:
+            if has_success:
                 print("\n🎉 분석 완료! 각 AI 서비스에서 결과를 확인하세요.")
                 
-                # 성공한 서비스별 URL 정보
-                for result in successful_uploads:
-                    if result.response_url:
-                        print(f"• {result.service_name}: {result.response_url}")
+                # 성공한 서비스별 URL 정보 (성공 개수도 같은 순회에서 집계)
+                success_count = 0
+                for result in upload_results:
+                    if result.success:
+                        success_count += 1
+                        if result.response_url:
+                            print(f"• {result.service_name}: {result.response_url}")
                 
-                logger.info(f"주식 분석 완료: {stock_code} - {len(successful_uploads)}개 서비스 성공")
+                logger.info(f"주식 분석 완료: {stock_code} - {success_count}개 서비스 성공")
                 return True
             else:
                 print("\n❌ 모든 AI 서비스 업로드 실패")
@@ -254,14 +299,6 @@ class MagicSplitGPT:
         except Exception as e:
             logger.error(f"주식 분석 프로세스 오류: {e}")
             print(f"\n❌ 분석 중 오류 발생: {e}")
-            
-            # 오류 발생 시에도 드라이버 종료
-            try:
-                self.stock_collector.close_driver_if_needed()
-                logger.info("오류 상황에서 브라우저 드라이버 정상 종료")
-            except Exception as driver_error:
-                logger.warning(f"오류 상황에서 드라이버 종료 중 오류: {driver_error}")
-            
             return False
     
     def run(self) -> None:
@@ -275,60 +312,61 @@ class MagicSplitGPT:
             
             logger.info("MagicSplitGPT 프로그램 시작")
             
-            # 메인 루프
-            while True:
-                try:
-                    # 전략 선택
-                    print("\n" + "="*50)
-                    strategy_choice = self.strategy_selector.select_strategy_interactive()
-                    
-                    if strategy_choice is None:
-                        print("\n👋 프로그램을 종료합니다.")
-                        break
-                    
-                    # 주식 코드 입력
-                    stock_code = self.strategy_selector.get_stock_code_input()
-                    
-                    if stock_code is None:
-                        print("🔄 전략 선택으로 돌아갑니다.")
-                        continue
-                    
-                    # 주식 분석 실행
-                    success = self._process_stock_analysis(stock_code, strategy_choice)
-                    
-                    if success:
-                        # 사용자 다음 행동 선택
-                        user_action = self.ai_automator.wait_for_user_action()
+            # 메인 루프 (수집용·AI 서비스 브라우저는 루프 동안 유지하고 종료 시 정리)
+            with self.stock_collector, self.ai_automator:
+                while True:
+                    try:
+                        # 전략 선택
+                        print("\n" + "="*50)
+                        strategy_choice = self.strategy_selector.select_strategy_interactive()
                         
-                        if user_action == 'exit':
+                        if strategy_choice is None:
                             print("\n👋 프로그램을 종료합니다.")
                             break
-                        else:
-                            print("\n🔄 새로운 분석을 시작합니다.")
-                            time.sleep(2)
+                        
+                        # 주식 코드 입력
+                        stock_code = self.strategy_selector.get_stock_code_input()
+                        
+                        if stock_code is None:
+                            print("🔄 전략 선택으로 돌아갑니다.")
                             continue
-                    else:
-                        # 실패시 재시도 옵션
-                        retry = input("\n다시 시도하시겠습니까? (Y/n): ").strip().lower()
-                        if retry not in ['', 'y', 'yes']:
-                            break
                         
-                except KeyboardInterrupt:
-                    print("\n\n👋 사용자가 프로그램을 중단했습니다.")
-                    break
-                    
-                except Exception as e:
-                    logger.error(f"메인 루프 오류: {e}")
-                    print(f"\n❌ 예상치 못한 오류가 발생했습니다: {e}")
-                    
-                    # 오류 발생시 계속 여부 확인
-                    try:
-                        continue_program = input("계속 진행하시겠습니까? (Y/n): ").strip().lower()
-                        if continue_program not in ['', 'y', 'yes']:
-                            break
-                    except (EOFError, KeyboardInterrupt):
-                        print("\n\n👋 프로그램을 종료합니다.")
+                        # 주식 분석 실행
+                        success = self._process_stock_analysis(stock_code, strategy_choice)
+                        
+                        if success:
+                            # 사용자 다음 행동 선택
+                            user_action = self.ai_automator.wait_for_user_action()
+                            
+                            if user_action == 'exit':
+                                print("\n👋 프로그램을 종료합니다.")
+                                break
+                            else:
+                                print("\n🔄 새로운 분석을 시작합니다.")
+                                time.sleep(2)
+                                continue
+                        else:
+                            # 실패시 재시도 옵션
+                            retry = input("\n다시 시도하시겠습니까? (Y/n): ").strip().lower()
+                            if retry not in ['', 'y', 'yes']:
+                                break
+                            
+                    except KeyboardInterrupt:
+                        print("\n\n👋 사용자가 프로그램을 중단했습니다.")
                         break
+                        
+                    except Exception as e:
+                        logger.error(f"메인 루프 오류: {e}")
+                        print(f"\n❌ 예상치 못한 오류가 발생했습니다: {e}")
+                        
+                        # 오류 발생시 계속 여부 확인
+                        try:
+                            continue_program = input("계속 진행하시겠습니까? (Y/n): ").strip().lower()
+                            if continue_program not in ['', 'y', 'yes']:
+                                break
+                        except (EOFError, KeyboardInterrupt):
+                            print("\n\n👋 프로그램을 종료합니다.")
+                            break
         
         except Exception as e:
             logger.critical(f"치명적 오류: {e}")
@@ -336,6 +374,8 @@ class MagicSplitGPT:
             sys.exit(1)
         
         finally:
+            # 진행 중인 백그라운드 작업이 끝날 때까지 대기
+            self._background_executor.shutdown(wait=True)
             logger.info("MagicSplitGPT 프로그램 종료")
             print("\n감사합니다! MagicSplitGPT를 사용해주셔서 감사합니다. 📊💰")
 
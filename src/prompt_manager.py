@@ -3,12 +3,37 @@
 """
 
 import os
-from typing import Dict, List, Optional
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
 from .config import Config
 
+# 템플릿 유효성 검사용 필수 키워드 (하나 이상 포함되어야 함, 한 번의 탐색으로 확인)
+_REQUIRED_KEYWORDS = ("매직스플릿", "주식", "분석")
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _REQUIRED_KEYWORDS)))
+
+# 템플릿 내용/유효성 디스크 캐시 (파일 경로, 수정시각, 크기가 같으면 재사용)
+# (코드 실행이 가능한 pickle 대신 JSON으로 저장)
+TEMPLATE_CACHE_PATH = Path("~/.cache/magicsplitgpt/templates.json").expanduser()
+
+# 전략별 설명
+_STRATEGY_DESCRIPTIONS = {
+    "magic_split_optimization": "매직스플릿 최적화 전략 - 종합적인 투자 분석 및 전략 수립",
+    "short_term_discovery": "단기 유망 종목 발굴 - 단기간 고수익 가능 종목 선별",
+    "buy_timing_diagnosis": "매수 타이밍 진단 - 현재 시점의 매수 적정성 판단",
+    "hold_or_cut_decision": "손절/보유 판단 - 보유 종목의 매도/보유 결정 지원",
+    "valuation_analysis": "밸류에이션 분석 - 기업 가치 평가 및 적정주가 산출"
+}
+
 
 class PromptManager:
     """프롬프트 템플릿 관리 클래스"""
@@ -23,12 +48,143 @@ class PromptManager:
         self.config = config
         self.templates_path = Path(config.prompts.templates_path)
         self.available_strategies = config.prompts.strategies
+        self._available_strategies_tuple: Tuple[str, ...] = tuple(self.available_strategies)
         self._templates_cache: Dict[str, str] = {}
+        self._missing_templates: Set[str] = set()
+        self._template_keys: Dict[str, List[object]] = {}
+        self._valid_flags: Dict[str, bool] = {}
+        self._disk_cache_dirty = False
         
         # 템플릿 디렉토리 존재 확인
         if not self.templates_path.exists():
             logger.error(f"프롬프트 템플릿 디렉토리를 찾을 수 없습니다: {self.templates_path}")
             raise FileNotFoundError(f"템플릿 디렉토리 없음: {self.templates_path}")
+        
+        # 모든 템플릿을 한 번에 읽어 캐시 (이후 로드/검사는 파일을 다시 읽지 않음)
+        self._preload_templates()
+    
+    def _read_template_file(self, strategy_name: str) -> Optional[str]:
+        """
+        템플릿 파일 내용 읽기
+        
+        Args:
+            strategy_name: 전략 이름
+            
+        Returns:
+            템플릿 내용 또는 None (파일 없음)
+        """
+        try:
+            return (self.templates_path / f"{strategy_name}.txt").read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+    
+    def _template_key(self, strategy_name: str) -> Optional[List[object]]:
+        """
+        디스크 캐시 키 계산 (JSON에서 읽은 키와 그대로 비교하도록 리스트로 반환)
+        
+        Args:
+            strategy_name: 전략 이름
+            
+        Returns:
+            [파일 경로, 수정시각(ns), 크기] 또는 None (파일 없음)
+        """
+        template_file = self.templates_path / f"{strategy_name}.txt"
+        try:
+            stat = template_file.stat()
+        except FileNotFoundError:
+            return None
+        return [str(template_file.resolve()), stat.st_mtime_ns, stat.st_size]
+    
+    def _load_disk_cache(self) -> Dict[str, Dict[str, object]]:
+        """템플릿 디스크 캐시 로드"""
+        try:
+            data = TEMPLATE_CACHE_PATH.read_bytes()
+            entries = orjson.loads(data) if orjson is not None else json.loads(data)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"템플릿 디스크 캐시 로드 실패: {e}")
+            return {}
+        
+        if not isinstance(entries, dict):
+            logger.warning("템플릿 디스크 캐시 형식이 올바르지 않아 무시합니다")
+            return {}
+        return entries
+    
+    def _save_disk_cache(self) -> None:
+        """템플릿 디스크 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        entries = {
+            name: {
+                "key": key,
+                "content": self._templates_cache[name],
+                "valid": self._valid_flags.get(name)
+            }
+            for name, key in self._template_keys.items()
+            if name in self._templates_cache
+        }
+        
+        try:
+            TEMPLATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = TEMPLATE_CACHE_PATH.with_suffix(".tmp")
+            if orjson is not None:
+                data = orjson.dumps(entries)
+            else:
+                data = json.dumps(entries, ensure_ascii=False).encode('utf-8')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, TEMPLATE_CACHE_PATH)
+            self._disk_cache_dirty = False
+        except Exception as e:
+            logger.warning(f"템플릿 디스크 캐시 저장 실패: {e}")
+    
+    def _preload_templates(self) -> None:
+        """사용 가능한 모든 템플릿을 캐시에 저장 (변경되지 않은 파일은 디스크 캐시 사용)"""
+        strategies = self.available_strategies
+        if not strategies:
+            return
+        
+        disk_cache = self._load_disk_cache()
+        stale: List[str] = []
+        disk_hits = 0
+        
+        for strategy_name in strategies:
+            key = self._template_key(strategy_name)
+            if key is None:
+                self._missing_templates.add(strategy_name)
+                logger.warning(f"프롬프트 템플릿 파일이 없습니다: {strategy_name}")
+                continue
+            
+            self._template_keys[strategy_name] = key
+            entry = disk_cache.get(strategy_name)
+            if (
+                isinstance(entry, dict)
+                and entry.get("key") == key
+                and isinstance(entry.get("content"), str)
+            ):
+                self._templates_cache[strategy_name] = entry["content"]
+                if isinstance(entry.get("valid"), bool):
+                    self._valid_flags[strategy_name] = entry["valid"]
+                disk_hits += 1
+            else:
+                stale.append(strategy_name)
+        
+        # 변경된 템플릿만 동시에 다시 읽기
+        if stale:
+            self._disk_cache_dirty = True
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                contents = list(executor.map(self._read_template_file, stale))
+            
+            for strategy_name, content in zip(stale, contents):
+                if content is None:
+                    self._template_keys.pop(strategy_name, None)
+                    self._missing_templates.add(strategy_name)
+                    logger.warning(f"프롬프트 템플릿 파일이 없습니다: {strategy_name}")
+                else:
+                    self._templates_cache[strategy_name] = content
+        
+        logger.debug(
+            f"프롬프트 템플릿 미리 로드: {len(self._templates_cache)}/{len(strategies)} "
+            f"(디스크 캐시 사용 {disk_hits}개)"
+        )
     
     def load_template(self, strategy_name: str) -> Optional[str]:
         """
@@ -53,11 +209,11 @@ class PromptManager:
         template_file = self.templates_path / f"{strategy_name}.txt"
         
         try:
-            with open(template_file, 'r', encoding='utf-8') as file:
-                template_content = file.read()
-                
+            template_content = template_file.read_text(encoding='utf-8')
+            
             # 캐시에 저장
             self._templates_cache[strategy_name] = template_content
+            self._missing_templates.discard(strategy_name)
             logger.info(f"프롬프트 템플릿 로드 완료: {strategy_name}")
             
             return template_content
@@ -69,14 +225,14 @@ class PromptManager:
             logger.error(f"프롬프트 템플릿 로드 실패: {e}")
             return None
     
-    def get_available_strategies(self) -> List[str]:
+    def get_available_strategies(self) -> Tuple[str, ...]:
         """
-        사용 가능한 전략 목록 반환
+        사용 가능한 전략 목록 반환 (수정이 필요하면 호출 측에서 list로 변환)
         
         Returns:
-            전략 이름 리스트
+            전략 이름 튜플
         """
-        return self.available_strategies.copy()
+        return self._available_strategies_tuple
     
     def get_strategy_description(self, strategy_name: str) -> str:
         """
@@ -88,15 +244,7 @@ class PromptManager:
         Returns:
             전략 설명
         """
-        descriptions = {
-            "magic_split_optimization": "매직스플릿 최적화 전략 - 종합적인 투자 분석 및 전략 수립",
-            "short_term_discovery": "단기 유망 종목 발굴 - 단기간 고수익 가능 종목 선별",
-            "buy_timing_diagnosis": "매수 타이밍 진단 - 현재 시점의 매수 적정성 판단",
-            "hold_or_cut_decision": "손절/보유 판단 - 보유 종목의 매도/보유 결정 지원",
-            "valuation_analysis": "밸류에이션 분석 - 기업 가치 평가 및 적정주가 산출"
-        }
-        
-        return descriptions.get(strategy_name, "설명 없음")
+        return _STRATEGY_DESCRIPTIONS.get(strategy_name, "설명 없음")
     
     def reload_template(self, strategy_name: str) -> Optional[str]:
         """
@@ -111,10 +259,36 @@ class PromptManager:
         # 캐시에서 제거
         if strategy_name in self._templates_cache:
             del self._templates_cache[strategy_name]
+        self._missing_templates.discard(strategy_name)
+        self._valid_flags.pop(strategy_name, None)
+        if self._template_keys.pop(strategy_name, None) is not None:
+            self._disk_cache_dirty = True
         
         logger.info(f"템플릿 다시 로드: {strategy_name}")
         return self.load_template(strategy_name)
     
+    def _validate_content(self, content: str, template_file: Path) -> bool:
+        """
+        메모리에 있는 템플릿 내용의 유효성 검사
+        
+        Args:
+            content: 템플릿 내용
+            template_file: 로그에 표시할 템플릿 파일 경로
+            
+        Returns:
+            유효성 검사 결과
+        """
+        if not content.strip():
+            logger.error(f"템플릿 파일이 비어있습니다: {template_file}")
+            return False
+        
+        # 기본적인 내용 검증 (매직스플릿 관련 키워드 포함 여부)
+        if _KEYWORD_RE.search(content) is None:
+            logger.warning(f"템플릿에 필수 키워드가 없습니다: {template_file}")
+            return False
+        
+        return True
+    
     def validate_template(self, strategy_name: str) -> bool:
         """
         템플릿 파일의 유효성 검사
@@ -127,27 +301,33 @@ class PromptManager:
         """
         template_file = self.templates_path / f"{strategy_name}.txt"
         
-        if not template_file.exists():
-            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_file}")
-            return False
+        # 이전 실행에서 통과한 뒤 바뀌지 않은 템플릿은 다시 검사하지 않음
+        if self._valid_flags.get(strategy_name) is True and strategy_name in self._templates_cache:
+            logger.info(f"템플릿 유효성 검사 통과 (캐시): {strategy_name}")
+            return True
         
         try:
-            with open(template_file, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = self._templates_cache.get(strategy_name)
+            if content is None:
+                content = template_file.read_text(encoding='utf-8')
             
-            if not content.strip():
-                logger.error(f"템플릿 파일이 비어있습니다: {template_file}")
-                return False
+            valid = self._validate_content(content, template_file)
+            if strategy_name in self._template_keys and self._valid_flags.get(strategy_name) != valid:
+                self._valid_flags[strategy_name] = valid
+                self._disk_cache_dirty = True
             
-            # 기본적인 내용 검증 (매직스플릿 관련 키워드 포함 여부)
-            required_keywords = ["매직스플릿", "주식", "분석"]
-            if not any(keyword in content for keyword in required_keywords):
-                logger.warning(f"템플릿에 필수 키워드가 없습니다: {template_file}")
+            if not valid:
                 return False
             
+            # 검사에 사용한 내용을 캐시에 저장 (load_template에서 다시 읽지 않음)
+            self._templates_cache.setdefault(strategy_name, content)
+            
             logger.info(f"템플릿 유효성 검사 통과: {strategy_name}")
             return True
             
+        except FileNotFoundError:
+            logger.error(f"템플릿 파일이 존재하지 않습니다: {template_file}")
+            return False
         except Exception as e:
             logger.error(f"템플릿 유효성 검사 실패: {e}")
             return False
@@ -159,16 +339,23 @@ class PromptManager:
         Returns:
             각 템플릿의 유효성 검사 결과
         """
-        validation_results = {}
+        strategies = self.available_strategies
+        if not strategies:
+            return {}
         
-        for strategy in self.available_strategies:
-            validation_results[strategy] = self.validate_template(strategy)
+        # 템플릿 파일마다 독립적인 파일 I/O이므로 동시에 검사
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            validation_results = dict(zip(strategies, executor.map(self.validate_template, strategies)))
         
         valid_count = sum(validation_results.values())
         total_count = len(validation_results)
         
         logger.info(f"템플릿 유효성 검사 완료: {valid_count}/{total_count} 통과")
         
+        # 내용이나 검사 결과가 바뀐 경우에만 디스크 캐시 갱신
+        if self._disk_cache_dirty:
+            self._save_disk_cache()
+        
         return validation_results
     
     def get_template_info(self, strategy_name: str) -> Dict[str, any]:
@@ -178,6 +365,29 @@ class PromptManager:
         Args:
             strategy_name: 전략 이름
             
+        Returns:
+            템플릿 정보 딕셔너리
+        """
+        try:
+            # stat 한 번으로 존재 여부와 크기/수정시각 확인
+            stat = (self.templates_path / f"{strategy_name}.txt").stat()
+        except FileNotFoundError:
+            stat = None
+        
+        return self._build_template_info(strategy_name, stat)
+    
+    def _build_template_info(
+        self,
+        strategy_name: str,
+        stat: Optional[os.stat_result]
+    ) -> Dict[str, any]:
+        """
+        이미 얻은 stat 결과로 템플릿 정보 구성
+        
+        Args:
+            strategy_name: 전략 이름
+            stat: 템플릿 파일 stat 결과 (파일이 없으면 None)
+            
         Returns:
             템플릿 정보 딕셔너리
         """
@@ -187,26 +397,30 @@ class PromptManager:
             "name": strategy_name,
             "description": self.get_strategy_description(strategy_name),
             "file_path": str(template_file),
-            "exists": template_file.exists(),
+            "exists": False,
             "valid": False,
             "size": 0,
             "content_preview": ""
         }
         
-        if template_file.exists():
-            try:
-                stat = template_file.stat()
-                info["size"] = stat.st_size
-                info["modified_time"] = stat.st_mtime
-                
-                with open(template_file, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    info["content_preview"] = content[:200] + "..." if len(content) > 200 else content
-                
-                info["valid"] = self.validate_template(strategy_name)
-                
-            except Exception as e:
-                logger.error(f"템플릿 정보 수집 실패: {e}")
+        if stat is None:
+            return info
+        
+        info["exists"] = True
+        info["size"] = stat.st_size
+        info["modified_time"] = stat.st_mtime
+        
+        try:
+            content = self._templates_cache.get(strategy_name)
+            if content is None:
+                content = template_file.read_text(encoding='utf-8')
+            info["content_preview"] = content[:200] + "..." if len(content) > 200 else content
+            
+            # 같은 내용으로 유효성 확인 (파일을 다시 읽지 않음)
+            info["valid"] = self._validate_content(content, template_file)
+            
+        except Exception as e:
+            logger.error(f"템플릿 정보 수집 실패: {e}")
         
         return info
     
@@ -217,10 +431,22 @@ class PromptManager:
         Returns:
             템플릿 파일 정보 리스트
         """
+        # 디렉토리를 한 번만 훑어 템플릿 파일 목록 확보
+        try:
+            with os.scandir(self.templates_path) as it:
+                entries = {entry.name: entry for entry in it if entry.is_file()}
+        except OSError as e:
+            logger.warning(f"템플릿 디렉토리 조회 실패: {e}")
+            entries = {}
+        
         template_files = []
         
         for strategy in self.available_strategies:
-            template_info = self.get_template_info(strategy)
+            entry = entries.get(f"{strategy}.txt")
+            if entry is None:
+                template_info = self.get_template_info(strategy)
+            else:
+                template_info = self._build_template_info(strategy, entry.stat())
             template_files.append(template_info)
         
         return template_files
@@ -228,6 +454,7 @@ class PromptManager:
     def clear_cache(self) -> None:
         """템플릿 캐시 초기화"""
         self._templates_cache.clear()
+        self._valid_flags.clear()
         logger.info("프롬프트 템플릿 캐시가 초기화되었습니다")
     
     def get_cache_status(self) -> Dict[str, any]:
@@ -240,5 +467,6 @@ class PromptManager:
         return {
             "cached_templates": list(self._templates_cache.keys()),
             "cache_size": len(self._templates_cache),
+            "missing_templates": sorted(self._missing_templates),
             "total_templates": len(self.available_strategies)
         }
\ No newline at end of file
@@ -4,26 +4,284 @@
 
 import time
 import os
-import base64
-from typing import Dict, List, Optional, Tuple
+import atexit
+import binascii
+import shutil
+import multiprocessing
+import queue
+import threading
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+try:
+    import requests  # 브라우저 없이 읽을 수 있는 페이지용 HTTP 클라이언트
+except ImportError:  # 없으면 모든 페이지를 브라우저로 읽음
+    requests = None
+
+try:
+    import websocket  # websocket-client (CDP 세션 직접 연결용)
+except ImportError:  # 없으면 execute_cdp_cmd만 사용
+    websocket = None
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # lxml이 없으면 내장 파서 사용
+    _HTML_PARSER = "html.parser"
+
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from .config import Config
 
+# 수집기 기본 Chrome 사용자 프로필 (보조지표 설정 저장용)
+DEFAULT_PROFILE_DIR = os.path.expanduser("~/magicSplitGPT_chrome_profile")
+
+# 수집용 Chrome에서 끌 백그라운드 기능 (webdriver.chrome.lean_mode)
+_LEAN_CHROME_ARGS = [
+    "--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+]
+
+# 스크린샷을 찍지 않는 데이터 전용 페이지에서 차단할 하위 리소스 (CDP Network.setBlockedURLs)
+_DATA_PAGE_BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.gif",
+    "*.woff*",
+    "*google-analytics*",
+    "*doubleclick*",
+    "*ad.naver*",
+]
+
+# 스크린샷은 찍지만 표 데이터가 중심인 페이지(투자자별 매매동향)에서 차단할 리소스
+# 등락 표시 아이콘 등 이미지와 스타일시트는 캡처에 필요하므로 웹폰트와 광고/분석 스크립트만 차단
+_TABLE_PAGE_BLOCKED_URLS = [
+    "*.woff*",
+    "*google-analytics*",
+    "*doubleclick*",
+    "*ad.naver*",
+]
+
+# undetected-chromedriver는 실행 시 chromedriver 바이너리를 패치하므로 동시에 띄우지 않음
+_driver_launch_lock = threading.Lock()
+
+# 여러 스레드가 같은 JSONL 로그에 덧붙일 때 줄이 섞이지 않도록 기록을 직렬화
+_jsonl_lock = threading.Lock()
+
+# 페이지별 CSS 선택자 (XPath 텍스트 검색 대신 CSS 사용)
+MAIN_PAGE_READY = (".today", ".chart_area", "#chart", ".graph_wrap")
+MAIN_CHART = ("#chart", ".chart", ".chart_area", ".graph_image")
+COINFO_IFRAME = "iframe#coinfo_cp"
+NEWS_PAGE_READY = ".tb_cont, .newsList li, iframe#news_frame"
+NEWS_PAGE_ROW = ".tb_cont, .newsList li"
+INVESTOR_TABLE = ".type2, .tb_cont"
+CHART_TAB = "a[href*='fchart']"
+CHART_SECTION = ".section.section_chart.inner_sub"
+CHART_AREA_FALLBACK = "cq-context, .chart_area, #chart"
+CHART_CANVAS = "cq-context canvas"
+HOUR_INTERVAL_ITEM = 'cq-item[interval="60"]'
+
+# 전문 차트 로딩·전환 대기 제한 시간 (초)
+CHART_LOAD_TIMEOUT = 15
+
+# 보조지표 메뉴 (cq-studies 목록을 가진 차트 도구 모음의 cq-menu)와 메뉴 안의 요소
+# 감싸는 div 위치에 의존하지 않도록 메뉴가 가진 cq-studies로 찾는다.
+INDICATOR_MENU = "cq-context cq-menu:has(cq-studies)"
+INDICATOR_MENU_TOGGLE = ":scope > span"
+MACD_ITEM = "cq-studies-content > cq-item:nth-of-type(9) > cq-label"
+RSI_ITEM = "cq-studies-content > cq-item:nth-of-type(12)"
+STOCH_ITEM = "cq-studies-content > cq-item:nth-of-type(15)"
+INDICATOR_ITEMS = (MACD_ITEM, RSI_ITEM, STOCH_ITEM)
+
+# 차트에 추가된 보조지표 범례 항목 (프로필에 저장된 지표가 이미 적용됐는지 확인용)
+STUDY_LEGEND = "cq-study-legend"
+STUDY_LEGEND_LABEL = f"{STUDY_LEGEND} cq-label"
+
+# 지표 메뉴를 열고 지표 항목을 차례로 클릭 (execute_async_script, 완료 시 null 또는 찾지 못한 선택자 반환)
+# 메뉴 요소를 한 번 찾은 뒤 토글과 항목은 메뉴 범위 안에서만 찾는다.
+# 고정 지연 대신 항목이 나타날 때까지, 클릭 후에는 범례 항목이 늘어날 때까지 폴링한다.
+# (범례 영역이 없는 차트에서는 클릭 후 대기를 하지 않음)
+_ADD_INDICATORS_JS = """
+const [menuSelector, toggleSelector, itemSelectors, legendSelector, legendLabelSelector, timeoutMs, done] = arguments;
+const waitUntil = (check) => new Promise((resolve) => {
+    const start = performance.now();
+    const poll = () => {
+        const value = check();
+        if (value) return resolve(value);
+        if (performance.now() - start > timeoutMs) return resolve(null);
+        setTimeout(poll, 50);
+    };
+    poll();
+});
+const legendCount = () => document.querySelectorAll(legendLabelSelector).length;
+(async () => {
+    const menu = document.querySelector(menuSelector);
+    if (!menu) return done(menuSelector);
+    const toggle = menu.querySelector(toggleSelector);
+    if (!toggle) return done(toggleSelector);
+    toggle.click();
+    for (const selector of itemSelectors) {
+        const item = await waitUntil(() => menu.querySelector(selector));
+        if (!item) return done(selector);
+        const before = legendCount();
+        item.click();
+        if (document.querySelector(legendSelector)) await waitUntil(() => legendCount() > before);
+    }
+    done(null);
+})();
+"""
+
+# [탭할 선택자, 완료를 알리는 선택자] 단계를 차례로 실행 (execute_async_script)
+# 포인터 이벤트로 탭한 뒤 완료 선택자가 나타날 때까지 브라우저 안에서 폴링하고 {step, status} 반환
+_TAP_SEQUENCE_JS = """
+const [steps, timeoutMs, done] = arguments;
+const tap = (el) => {
+    const rect = el.getBoundingClientRect();
+    const eventOptions = {
+        bubbles: true,
+        cancelable: true,
+        view: window,
+        pointerId: 1,
+        button: 0,
+        clientX: rect.left + rect.width / 2,
+        clientY: rect.top + rect.height / 2,
+        isPrimary: true
+    };
+    el.dispatchEvent(new PointerEvent('pointerdown', eventOptions));
+    el.dispatchEvent(new PointerEvent('pointerup', eventOptions));
+};
+const waitFor = (sel) => new Promise((resolve) => {
+    const start = performance.now();
+    const poll = () => {
+        if (document.querySelector(sel)) return resolve(true);
+        if (performance.now() - start > timeoutMs) return resolve(false);
+        setTimeout(poll, 100);
+    };
+    poll();
+});
+(async () => {
+    for (let i = 0; i < steps.length; i++) {
+        const [tapSelector, doneSelector] = steps[i];
+        const target = document.querySelector(tapSelector);
+        if (!target) return done({step: i, status: 'missing'});
+        tap(target);
+        if (!(await waitFor(doneSelector))) return done({step: i, status: 'timeout'});
+    }
+    done({step: steps.length, status: 'ok'});
+})();
+"""
+
+# 기본 정보를 한 번의 호출로 읽기 (숨겨진 기업개요도 textContent로 읽으므로 팝업을 열지 않음)
+_BASIC_INFO_JS = """
+const text = (sel) => {
+    const el = document.querySelector(sel);
+    return el ? el.innerText.trim() : null;
+};
+const changes = Array.from(document.querySelectorAll('.today .no_exday em'), (el) => el.innerText.trim());
+const description = Array.from(document.querySelectorAll('.summary_info p'), (el) => el.textContent.trim())
+    .filter((t) => t && !t.startsWith('출처'));
+return {
+    stock_name: text('.wrap_company h2 a'),
+    stock_code: text('.wrap_company .description .code'),
+    current_price: text('.today .no_today em'),
+    price_change: changes,
+    company_description: description.join(' ')
+};
+"""
+
+# 첫 번째로 일치하는 표의 헤더 다음 행부터 셀 텍스트를 2차원 배열로 반환
+# (arguments: 표 선택자, 최대 행 수, 행마다 읽을 앞쪽 셀 수 - 쓰지 않는 열의 innerText는 읽지 않음)
+_TABLE_CELLS_JS = """
+const [tableSelector, maxRows, maxCells] = arguments;
+const table = document.querySelector(tableSelector);
+if (!table) return [];
+return Array.from(table.querySelectorAll('tr')).slice(1, maxRows + 1)
+    .map((tr) => Array.from(tr.querySelectorAll('td')).slice(0, maxCells).map((td) => td.innerText.trim()));
+"""
+
+# 기본 정보 HTTP 조회 제한 시간 (초)
+_HTTP_TIMEOUT = 5
+
+
+def _parse_basic_info_html(html: str) -> Dict[str, any]:
+    """
+    종목 메인 페이지 HTML에서 _BASIC_INFO_JS와 같은 형태의 기본 정보 추출
+    
+    Args:
+        html: 종목 메인 페이지 HTML
+        
+    Returns:
+        종목명, 종목코드, 현재가, 전일대비 목록, 기업개요
+    """
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    
+    def number_text(element) -> str:
+        # 숫자는 자리별 이미지 span으로 그려지고 전체 값은 .blind에 들어 있음
+        blind = element.select_one(".blind")
+        return (blind or element).get_text(strip=True)
+    
+    def text(selector: str) -> Optional[str]:
+        element = soup.select_one(selector)
+        return element.get_text(strip=True) if element else None
+    
+    current_price = soup.select_one(".today .no_today em")
+    description = [
+        t for t in (p.get_text(strip=True) for p in soup.select(".summary_info p"))
+        if t and not t.startswith("출처")
+    ]
+    
+    return {
+        "stock_name": text(".wrap_company h2 a"),
+        "stock_code": text(".wrap_company .description .code"),
+        "current_price": number_text(current_price) if current_price else None,
+        "price_change": [number_text(em) for em in soup.select(".today .no_exday em")],
+        "company_description": " ".join(description)
+    }
+
+
+@dataclass(slots=True)
+class NewsItem:
+    """뉴스공시 항목"""
+    title: str
+    date: str
+    source: str
+    index: int
 
-@dataclass
+
+@dataclass(slots=True)
+class InvestorTrend:
+    """투자자별 매매동향 일자별 행"""
+    date: str
+    foreign_buy: str
+    foreign_sell: str
+    institution_buy: str
+    institution_sell: str
+    individual_volume: str
+    index: int
+
+
+@dataclass(slots=True)
 class StockData:
     """주식 데이터 구조체"""
     stock_code: str
@@ -33,42 +291,104 @@ class StockData:
     change_rate: str
     volume: str
     market_cap: str
-    investment_opinion: Dict[str, any]
-    news_data: List[Dict[str, str]]
-    discussion_data: List[Dict[str, str]]
+    investment_opinion: str  # 기업개요 텍스트
+    news_data: List[NewsItem]
+    discussion_data: List[InvestorTrend]  # 투자자별 매매동향
     related_themes: List[str]
     chart_screenshots: Dict[str, str]  # 차트 종류별 스크린샷 경로
-    financial_data: Dict[str, any]
-    technical_indicators: Dict[str, any]
+    financial_data: Dict[str, str]
+    technical_indicators: Dict[str, str]
     collected_at: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> "StockData":
+        """
+        asdict로 저장한 딕셔너리에서 복원
+        
+        Args:
+            data: StockData 필드 딕셔너리
+            
+        Returns:
+            중첩 항목까지 복원한 StockData
+        """
+        return cls(**{
+            **data,
+            "news_data": [NewsItem(**item) for item in data.get("news_data", [])],
+            "discussion_data": [InvestorTrend(**item) for item in data.get("discussion_data", [])]
+        })
+    
+    def to_json_line(self) -> bytes:
+        """
+        JSONL 한 줄로 직렬화 (줄바꿈 포함)
+        
+        Returns:
+            UTF-8 JSON 바이트
+        """
+        if orjson is not None:
+            return orjson.dumps(asdict(self), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return json.dumps(asdict(self), ensure_ascii=False).encode('utf-8') + b"\n"
 
 
 class StockDataCollector:
     """네이버 증권 데이터 수집 클래스"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, profile_dir: Optional[str] = None):
         """
         데이터 수집기 초기화
         
         Args:
             config: 설정 객체
+            profile_dir: Chrome 사용자 프로필 경로 (None이면 기본 프로필)
         """
         self.config = config
+        self.profile_dir = profile_dir or DEFAULT_PROFILE_DIR
         self.driver: Optional[uc.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        
+        # 현재 탭에 직접 연결한 CDP 웹소켓 (없으면 execute_cdp_cmd 사용)
+        self._cdp_ws = None
+        self._cdp_msg_id = 0
+        
+        # 기본 정보 HTTP 조회용 세션 (처음 사용할 때 생성)
+        self._http_session = None
+        
+        # 현재 적용 중인 차단 URL 패턴 (None이면 차단 안 함)
+        self._blocked_urls: Optional[List[str]] = None
+        
+        # 전문 차트 페이지에서 찾은 차트 영역 요소와 선택자 이름 (캡처마다 다시 찾지 않음)
+        self._chart_area: Optional[Tuple[Optional[object], Optional[str]]] = None
+        
+        # 차트 영역을 처음 찾은 (선택자, 이름) - 이후 종목은 실패한 선택자를 다시 시도하지 않음
+        self._chart_area_selector: Optional[Tuple[str, str]] = None
+        
+        # 현재 드라이버에서 보조지표 설정을 마쳤는지 (이후 종목은 메뉴를 다시 열지 않음)
+        self._indicators_configured = False
+        
         self.base_screenshot_dir = Path(config.screenshot.save_path)
         self.current_stock_screenshot_dir = None
+        self.current_run_ts: Optional[str] = None
+        
+        # CDP 캡처 형식과 파일 확장자 (jpg는 CDP에서 jpeg로 지정)
+        screenshot_format = config.screenshot.format.lower()
+        self._cdp_format = "jpeg" if screenshot_format == "jpg" else screenshot_format
+        self._screenshot_ext = "jpg" if self._cdp_format == "jpeg" else self._cdp_format
+        
+        # 백업용 전체 화면 캡처 형식 (버려지는 경우가 많아 기본은 작은 jpeg)
+        fallback_format = config.screenshot.fallback_format.lower()
+        self._fallback_cdp_format = "jpeg" if fallback_format == "jpg" else fallback_format
+        self._fallback_ext = "jpg" if self._fallback_cdp_format == "jpeg" else self._fallback_cdp_format
         
         # 기본 스크린샷 디렉토리 생성
         self.base_screenshot_dir.mkdir(exist_ok=True)
+        
+        # 최근 수집 결과 캐시 (종목 코드별 JSON)
+        self.cache_dir = self.base_screenshot_dir / "_cache"
     
     def _setup_driver(self) -> None:
         """Chrome 드라이버 설정"""
         try:
-            import os
-            
             # Chrome 사용자 프로필 디렉토리 설정 (보조지표 저장용)
-            user_data_dir = os.path.expanduser("~/magicSplitGPT_chrome_profile")
+            user_data_dir = self.profile_dir
             os.makedirs(user_data_dir, exist_ok=True)
             
             # undetected-chromedriver에 사용자 프로필 옵션 추가
@@ -87,17 +407,29 @@ class StockDataCollector:
             chrome_options.add_argument('--disable-web-security')  # iframe 접근용
             chrome_options.add_argument('--allow-running-insecure-content')  # iframe 접근용
             
-            # undetected-chromedriver로 드라이버 생성
-            try:
-                self.driver = uc.Chrome(options=chrome_options)
-                logger.info(f"Chrome 사용자 프로필 설정 완료: {user_data_dir}")
-            except Exception as e:
-                logger.warning(f"옵션과 함께 드라이버 생성 실패, 기본 설정으로 재시도: {e}")
-                # 기본 설정으로 재시도
-                self.driver = uc.Chrome()
+            # 스크래핑에 필요 없는 백그라운드 작업 줄이기 (이미지는 페이지별 CDP 차단으로 처리)
+            if self.config.webdriver.lean_mode:
+                for arg in _LEAN_CHROME_ARGS:
+                    chrome_options.add_argument(arg)
+            
+            # undetected-chromedriver로 드라이버 생성 (BrowserPool 스레드끼리는 한 번에 하나씩)
+            with _driver_launch_lock:
+                try:
+                    self.driver = uc.Chrome(options=chrome_options)
+                    logger.info(f"Chrome 사용자 프로필 설정 완료: {user_data_dir}")
+                except Exception as e:
+                    logger.warning(f"옵션과 함께 드라이버 생성 실패, 기본 설정으로 재시도: {e}")
+                    # 기본 설정으로 재시도
+                    self.driver = uc.Chrome()
+            
+            # 스크린샷 등 CDP 명령을 보낼 세션 연결
+            self._open_cdp_session()
+            
+            # 대기 시간 설정 (암묵적 대기는 끄고 명시적 대기만 사용)
+            self.driver.implicitly_wait(0)
             
-            # 대기 시간 설정
-            self.driver.implicitly_wait(self.config.webdriver.implicit_wait)
+            # 브라우저 안에서 여러 단계를 폴링하는 비동기 스크립트용 제한 시간
+            self.driver.set_script_timeout(CHART_LOAD_TIMEOUT * 3)
             self.wait = WebDriverWait(self.driver, self.config.webdriver.wait_timeout)
             
             # 브라우저 줌 레벨을 60%로 설정
@@ -110,14 +442,132 @@ class StockDataCollector:
             logger.error(f"드라이버 설정 실패: {e}")
             raise
     
+    def _open_cdp_session(self) -> None:
+        """
+        현재 탭의 CDP 웹소켓에 직접 연결
+        
+        execute_cdp_cmd는 명령마다 chromedriver를 거치므로, 연결해 둔 세션으로
+        명령을 보내 왕복을 줄인다. 연결할 수 없으면 execute_cdp_cmd를 계속 사용한다.
+        """
+        if websocket is None:
+            return
+        
+        try:
+            debugger_address = self.driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+            with urllib.request.urlopen(f"http://{debugger_address}/json/list", timeout=2) as response:
+                targets = json.loads(response.read())
+            
+            # chromedriver의 창 핸들은 CDP 대상 ID와 같음
+            target_id = self.driver.current_window_handle
+            ws_url = next(t["webSocketDebuggerUrl"] for t in targets if t.get("id") == target_id)
+            
+            self._cdp_ws = websocket.create_connection(ws_url, timeout=30, suppress_origin=True)
+            logger.info("CDP 세션 연결 완료")
+        except Exception as e:
+            logger.debug(f"CDP 세션 연결 실패, execute_cdp_cmd 사용: {e}")
+            self._cdp_ws = None
+    
+    def _close_cdp_session(self) -> None:
+        """CDP 웹소켓 연결 종료"""
+        if self._cdp_ws is not None:
+            try:
+                self._cdp_ws.close()
+            except Exception:
+                pass
+            self._cdp_ws = None
+    
+    def _cdp_send(self, method: str, params: Optional[Dict] = None) -> Dict:
+        """
+        CDP 명령 실행 (연결된 세션 우선, 오류 시 execute_cdp_cmd로 대체)
+        
+        Args:
+            method: CDP 메서드 이름 (예: Page.captureScreenshot)
+            params: 명령 인자
+            
+        Returns:
+            명령 결과
+        """
+        params = params or {}
+        
+        if self._cdp_ws is not None:
+            try:
+                self._cdp_msg_id += 1
+                msg_id = self._cdp_msg_id
+                self._cdp_ws.send(json.dumps({"id": msg_id, "method": method, "params": params}))
+                
+                # 응답이 올 때까지 이벤트 메시지는 건너뜀
+                while True:
+                    message = json.loads(self._cdp_ws.recv())
+                    if message.get("id") == msg_id:
+                        break
+            except Exception as e:
+                logger.warning(f"CDP 세션 명령 실패, execute_cdp_cmd로 대체: {e}")
+                self._close_cdp_session()
+            else:
+                # 명령 자체의 오류는 세션을 유지한 채 호출자에게 전달
+                if "error" in message:
+                    raise RuntimeError(f"CDP {method} 실패: {message['error'].get('message')}")
+                return message.get("result", {})
+        
+        return self.driver.execute_cdp_cmd(method, params)
+    
+    def _enable_resource_blocking(self, urls: List[str] = _DATA_PAGE_BLOCKED_URLS) -> None:
+        """
+        페이지 하위 리소스 차단 (기본은 데이터 전용 페이지용 이미지·폰트·광고/분석 스크립트)
+        
+        Network 명령은 스크린샷용 CDP 웹소켓(_cdp_send)이 아니라 chromedriver 세션으로 보낸다.
+        웹소켓에서 Network 도메인을 켜면 이후 모든 요청 이벤트가 그 소켓에 쌓여
+        캡처 명령마다 밀린 이벤트를 읽어 넘겨야 하기 때문이다.
+        
+        Args:
+            urls: 차단할 URL 패턴 목록
+        """
+        if self._blocked_urls == urls:
+            return
+        
+        try:
+            if self._blocked_urls is None:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+            self._blocked_urls = urls
+        except Exception as e:
+            logger.debug(f"리소스 차단 설정 실패 (계속 진행): {e}")
+    
+    def _disable_resource_blocking(self) -> None:
+        """스크린샷 페이지 전에 리소스 차단 해제"""
+        if self._blocked_urls is None:
+            return
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            self._blocked_urls = None
+        except Exception as e:
+            logger.debug(f"리소스 차단 해제 실패 (계속 진행): {e}")
+    
     def _close_driver(self) -> None:
         """드라이버 종료"""
+        self._close_cdp_session()
+        self._blocked_urls = None
+        self._indicators_configured = False
+        self._chart_area_selector = None
         if self.driver:
             try:
                 self.driver.quit()
                 logger.info("Chrome 드라이버 종료")
             except Exception as e:
                 logger.error(f"드라이버 종료 실패: {e}")
+            finally:
+                # 다음 수집 때 새 드라이버를 띄우도록 초기화
+                self.driver = None
+                self.wait = None
+    
+    def _driver_alive(self) -> bool:
+        """드라이버(브라우저)가 아직 응답하는지 확인"""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
     
     def _setup_stock_screenshot_folder(self, stock_code: str, stock_name: str = None) -> None:
         """
@@ -128,7 +578,11 @@ class StockDataCollector:
             stock_name: 주식 이름 (선택사항)
         """
         # 현재 시간으로 폴더명 생성 (YYMMDDHHmm 형식)
-        timestamp = datetime.now().strftime("%y%m%d%H%M")
+        now = datetime.now()
+        timestamp = now.strftime("%y%m%d%H%M")
+        
+        # 이번 수집의 모든 파일이 공유하는 타임스탬프 (파일명용 긴 형식)
+        self.current_run_ts = now.strftime("%Y%m%d_%H%M%S")
         
         # 주식 이름이 있으면 폴더명에 포함 (특수문자 제거)
         if stock_name:
@@ -146,18 +600,48 @@ class StockDataCollector:
         self.current_stock_screenshot_dir.mkdir(exist_ok=True)
         logger.info(f"주식별 스크린샷 폴더 생성: {self.current_stock_screenshot_dir}")
     
-    def _take_basic_screenshot(self, filepath: str) -> bool:
+    def _take_basic_screenshot(
+        self,
+        filepath: str,
+        clip: Optional[Dict[str, float]] = None,
+        fallback: bool = False
+    ) -> bool:
         """
-        기본 스크린샷 캡처 방식
+        기본 스크린샷 캡처 방식 (CDP Page.captureScreenshot, 설정한 형식으로 인코딩)
         
         Args:
             filepath: 저장할 파일 경로
+            clip: 캡처할 문서 영역 (x, y, width, height, CSS 픽셀). None이면 현재 화면
+            fallback: True면 백업용 형식(fallback_format/fallback_quality)으로 인코딩
             
         Returns:
             스크린샷 성공 여부
         """
         try:
-            self.driver.save_screenshot(filepath)
+            if fallback:
+                image_format = self._fallback_cdp_format
+                quality = self.config.screenshot.fallback_quality
+            else:
+                image_format = self._cdp_format
+                quality = self.config.screenshot.quality
+            
+            params = {
+                "format": image_format,
+                "fromSurface": True,
+                "optimizeForSpeed": self.config.screenshot.optimize_for_speed
+            }
+            if image_format != "png":
+                params["quality"] = quality
+            if clip is not None:
+                # 화면 밖 영역도 스크롤·창 크기 변경 없이 렌더링해서 캡처
+                params["clip"] = {**clip, "scale": 1}
+                params["captureBeyondViewport"] = True
+            
+            result = self._cdp_send("Page.captureScreenshot", params)
+            
+            # CDP는 표준 base64를 반환하므로 binascii로 바로 디코딩해 기록 (중간 사본 없음)
+            Path(filepath).write_bytes(binascii.a2b_base64(result["data"]))
+            
             logger.info(f"기본 스크린샷 저장 완료: {filepath}")
             return True
             
@@ -165,6 +649,114 @@ class StockDataCollector:
             logger.error(f"기본 스크린샷 실패: {e}")
             return False
     
+    def _capture_element_cdp(self, element, filepath: str) -> bool:
+        """
+        요소 영역만 CDP로 캡처 (Selenium element.screenshot의 PNG 인코딩 대신 설정 형식 사용)
+        
+        Args:
+            element: 캡처할 웹 요소
+            filepath: 저장할 파일 경로
+            
+        Returns:
+            스크린샷 성공 여부
+        """
+        try:
+            # 문서 기준 좌표 (captureBeyondViewport clip은 스크롤 위치를 더한 좌표 사용)
+            rect = self.driver.execute_script(
+                "const r = arguments[0].getBoundingClientRect();"
+                "return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height};",
+                element
+            )
+        except StaleElementReferenceException:
+            # 요소가 교체된 경우는 호출자가 다시 찾도록 전달
+            raise
+        except Exception as e:
+            logger.error(f"요소 위치 계산 실패: {e}")
+            return False
+        
+        if rect["width"] <= 0 or rect["height"] <= 0:
+            logger.warning(f"크기가 없는 요소라 캡처하지 않음: {filepath}")
+            return False
+        
+        return self._take_basic_screenshot(filepath, clip=rect)
+    
+    def _wait_for_css(self, css_selector: str, visible: bool = False) -> bool:
+        """
+        선택자에 맞는 요소가 나타날 때까지 대기 (고정 sleep 대신 사용)
+        
+        Args:
+            css_selector: 기다릴 요소의 CSS 선택자
+            visible: True면 화면에 보일 때까지 대기
+            
+        Returns:
+            제한 시간 안에 나타났는지 여부
+        """
+        condition = EC.visibility_of_element_located if visible else EC.presence_of_element_located
+        try:
+            WebDriverWait(self.driver, self.config.webdriver.wait_timeout, poll_frequency=0.1).until(
+                condition((By.CSS_SELECTOR, css_selector))
+            )
+            return True
+        except TimeoutException:
+            logger.debug(f"요소 대기 시간 초과: {css_selector}")
+            return False
+    
+    def _run_tap_sequence(self, steps: List[Tuple[str, str]]) -> Dict[str, any]:
+        """
+        탭·완료 대기 단계를 한 번의 비동기 스크립트 호출로 실행
+        
+        Args:
+            steps: (탭할 CSS 선택자, 완료를 알리는 CSS 선택자) 목록
+            
+        Returns:
+            {"step": 멈춘 단계 번호, "status": "ok" | "missing" | "timeout"}
+        """
+        return self.driver.execute_async_script(
+            _TAP_SEQUENCE_JS, [list(step) for step in steps], CHART_LOAD_TIMEOUT * 1000
+        )
+    
+    def _wait_for_page_complete(self) -> None:
+        """문서와 하위 프레임 로딩이 끝날 때까지 대기"""
+        try:
+            WebDriverWait(self.driver, self.config.webdriver.wait_timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            logger.debug("문서 로딩 완료 대기 시간 초과")
+    
+    def _extract_list_items(
+        self,
+        item_selector: str,
+        limit: int,
+        fields: Dict[str, Tuple[str, Optional[str]]]
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        현재 페이지 소스를 한 번 가져와 목록 항목의 필드 추출
+        
+        Args:
+            item_selector: 항목 CSS 선택자
+            limit: 최대 항목 수
+            fields: 필드 이름 → (항목 안의 CSS 선택자, 우선 사용할 속성 또는 None)
+            
+        Returns:
+            항목별 필드 딕셔너리 (필드가 빠진 항목은 None)
+        """
+        soup = BeautifulSoup(self.driver.page_source, _HTML_PARSER)
+        rows = []
+        
+        for item in soup.select(item_selector)[:limit]:
+            row = {}
+            for name, (selector, attr) in fields.items():
+                element = item.select_one(selector)
+                if element is None:
+                    row = None
+                    break
+                value = attr and element.get(attr)
+                row[name] = value.strip() if value else element.get_text(" ", strip=True)
+            rows.append(row)
+        
+        return rows
+    
     def _navigate_to_stock(self, stock_code: str) -> bool:
         """
         특정 주식 페이지로 이동
@@ -181,28 +773,13 @@ class StockDataCollector:
             
             self.driver.get(stock_url)
             
-            # # 페이지 로딩 대기 - 여러 선택자로 시도
-            # selectors_to_try = [
-            #     (By.CLASS_NAME, "chart_area"),
-            #     (By.ID, "chart"),
-            #     (By.CLASS_NAME, "graph_wrap"),
-            #     (By.CLASS_NAME, "today"),
-            #     (By.TAG_NAME, "body")  # 최후의 수단
-            # ]
-            
-            # loaded = False
-            # for by, selector in selectors_to_try:
-            #     try:
-            #         self.wait.until(EC.presence_of_element_located((by, selector)))
-            #         logger.info(f"페이지 로딩 완료: {selector} 선택자로 확인")
-            #         loaded = True
-            #         break
-            #     except TimeoutException:
-            #         logger.debug(f"선택자 {selector} 로딩 실패, 다음 시도")
-            #         continue
-            
-            # if not loaded:
-            #     logger.warning("모든 선택자 로딩 실패, 기본 대기 시간으로 진행")
+            # 페이지 로딩 대기 - 여러 선택자 중 하나라도 나타나면 진행 (전체 대기 8초)
+            try:
+                WebDriverWait(self.driver, 8, poll_frequency=0.1).until(EC.any_of(
+                    *(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in MAIN_PAGE_READY)
+                ))
+            except TimeoutException:
+                logger.warning("모든 선택자 로딩 실패, 기본 대기 시간으로 진행")
             
             # 페이지 로드 후 브라우저 줌 레벨을 60%로 설정
             self.driver.execute_script("document.body.style.zoom='0.6'")
@@ -217,204 +794,105 @@ class StockDataCollector:
             logger.error(f"주식 페이지 이동 실패: {e}")
             return False
     
-    def _get_basic_info(self) -> Dict[str, str]:
-        """기본 주식 정보 수집 - Playwright 분석 결과 기반"""
-        basic_info = {}
+    def _get_http_session(self) -> "requests.Session":
+        """
+        기본 정보 조회용 HTTP 세션 반환 (수집기 수명 동안 재사용해 연결·TLS 핸드셰이크를 유지)
         
-        try:
-            # 종목명 - .wrap_company h2 a
-            stock_name_elem = self.driver.find_element(By.CSS_SELECTOR, ".wrap_company h2 a")
-            basic_info["stock_name"] = stock_name_elem.text.strip()
-            
-            # 종목코드 - .wrap_company .description .code
-            stock_code_elem = self.driver.find_element(By.CSS_SELECTOR, ".wrap_company .description .code")
-            basic_info["stock_code"] = stock_code_elem.text.strip()
-            
-            # 현재가 - .today .no_today em 안의 span들을 조합
-            current_price_elem = self.driver.find_element(By.CSS_SELECTOR, ".today .no_today em")
-            basic_info["current_price"] = current_price_elem.text.strip().replace(',', '')
-            
-            # 전일대비 - .today .no_exday em (첫 번째)
-            price_change_elements = self.driver.find_elements(By.CSS_SELECTOR, ".today .no_exday em")
-            if len(price_change_elements) >= 2:
-                price_change = price_change_elements[0].text.strip().replace(',', '')
-                change_rate = price_change_elements[1].text.strip()
-                basic_info["price_change"] = price_change
-                basic_info["change_rate"] = change_rate
-            
-            # 기업개요 - .summary_info p 텍스트
-            try:
-                # 기업개요 팝업을 열기 위해 클릭 (숨겨진 정보)
-                summary_elem = self.driver.find_element(By.CSS_SELECTOR, ".summary a")
-                self.driver.execute_script("arguments[0].click();", summary_elem)
-                time.sleep(1)
-                
-                company_desc_elements = self.driver.find_elements(By.CSS_SELECTOR, ".summary_info p")
-                company_description = []
-                for elem in company_desc_elements:
-                    text = elem.text.strip()
-                    if text and not text.startswith('출처'):
-                        company_description.append(text)
-                
-                basic_info["company_description"] = " ".join(company_description)
-                
-                # 팝업 닫기
-                close_btn = self.driver.find_element(By.CSS_SELECTOR, ".summary_lyr .btn_area_top a")
-                self.driver.execute_script("arguments[0].click();", close_btn)
-                
-            except Exception as desc_error:
-                logger.debug(f"기업개요 수집 실패: {desc_error}")
-                basic_info["company_description"] = "정보 없음"
-            
-            logger.info(f"기본 정보 수집 완료: {basic_info['stock_name']} ({basic_info['stock_code']})")
-            
-        except Exception as e:
-            logger.error(f"기본 정보 수집 실패: {e}")
-            # 최소한의 정보라도 수집 시도
-            try:
-                basic_info["stock_name"] = self.driver.title.split(':')[0].strip() if ':' in self.driver.title else "정보 없음"
-            except:
-                basic_info["stock_name"] = "정보 없음"
-            
-        return basic_info
+        Returns:
+            requests 세션
+        """
+        if self._http_session is None:
+            self._http_session = requests.Session()
+            self._http_session.headers.update({
+                "User-Agent": self.config.webdriver.user_agent,
+                "Referer": self.config.naver_finance.base_url + "/"
+            })
+        return self._http_session
     
-    def _get_investment_opinion(self) -> Dict[str, any]:
-        """투자 의견 정보 수집"""
-        investment_data = {}
+    def _close_http_session(self) -> None:
+        """HTTP 세션 종료"""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+    
+    def _fetch_basic_info(self, stock_code: str) -> Optional[Dict[str, any]]:
+        """
+        브라우저 없이 HTTP로 종목 메인 페이지를 받아 기본 정보 추출
+        (requests가 없거나 실패하면 None, 브라우저로 대체)
         
-        try:
-            # 투자의견 탭으로 이동
-            opinion_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'투자의견')]")
-            opinion_tab.click()
-            time.sleep(2)
-            
-            # 투자의견 데이터 수집
-            opinion_table = self.driver.find_element(By.CLASS_NAME, "type_1")
-            rows = opinion_table.find_elements(By.TAG_NAME, "tr")
-            
-            opinions = []
-            for row in rows[1:6]:  # 최근 5개만
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 4:
-                    opinion = {
-                        "date": cells[0].text,
-                        "company": cells[1].text,
-                        "opinion": cells[2].text,
-                        "target_price": cells[3].text
-                    }
-                    opinions.append(opinion)
-            
-            investment_data["opinions"] = opinions
-            logger.info(f"투자의견 {len(opinions)}개 수집 완료")
-            
-        except Exception as e:
-            logger.error(f"투자의견 수집 실패: {e}")
-            investment_data["opinions"] = []
+        Args:
+            stock_code: 주식 코드
             
-        return investment_data
-    
-    def _get_news_data(self) -> List[Dict[str, str]]:
-        """뉴스 및 공시 정보 수집"""
-        news_data = []
+        Returns:
+            _BASIC_INFO_JS 형태의 기본 정보 (필수 항목이 없으면 None)
+        """
+        if requests is None:
+            return None
         
         try:
-            # 뉴스 탭으로 이동
-            news_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'뉴스')]")
-            news_tab.click()
-            time.sleep(2)
-            
-            # 뉴스 데이터 수집
-            news_list = self.driver.find_elements(By.CLASS_NAME, "tb_cont")
-            
-            for news_item in news_list[:10]:  # 최근 10개만
-                try:
-                    title_elem = news_item.find_element(By.TAG_NAME, "a")
-                    title = title_elem.get_attribute("title") or title_elem.text
-                    
-                    date_elem = news_item.find_element(By.CLASS_NAME, "date")
-                    date = date_elem.text
-                    
-                    source_elem = news_item.find_element(By.CLASS_NAME, "press")
-                    source = source_elem.text
-                    
-                    news_data.append({
-                        "title": title,
-                        "date": date,
-                        "source": source
-                    })
-                    
-                except Exception as news_error:
-                    logger.debug(f"개별 뉴스 수집 실패: {news_error}")
-                    continue
+            response = self._get_http_session().get(
+                self.config.get_stock_url(stock_code), timeout=_HTTP_TIMEOUT
+            )
+            response.raise_for_status()
             
-            logger.info(f"뉴스 {len(news_data)}개 수집 완료")
+            # 네이버 증권은 EUC-KR 페이지가 섞여 있으므로 헤더에 charset이 없으면 내용으로 판단
+            if "charset" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = response.apparent_encoding
             
+            info = _parse_basic_info_html(response.text)
         except Exception as e:
-            logger.error(f"뉴스 데이터 수집 실패: {e}")
-            
-        return news_data
+            logger.warning(f"HTTP 기본 정보 조회 실패, 브라우저로 진행: {e}")
+            return None
+        
+        if not all(info.get(key) for key in ("stock_name", "stock_code", "current_price")):
+            return None
+        return info
     
-    def _get_discussion_data(self) -> List[Dict[str, str]]:
-        """토론실 정보 수집"""
-        discussion_data = []
+    def _get_basic_info(self, info: Optional[Dict[str, any]] = None) -> Dict[str, str]:
+        """
+        기본 주식 정보 수집 - Playwright 분석 결과 기반
         
-        try:
-            # 토론실 탭으로 이동
-            discussion_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'토론실')]")
-            discussion_tab.click()
-            time.sleep(2)
-            
-            # 토론실 데이터 수집
-            discussion_list = self.driver.find_elements(By.CLASS_NAME, "tb_cont")
+        Args:
+            info: HTTP로 미리 읽은 기본 정보 (None이면 현재 브라우저 페이지에서 조회)
             
-            for discussion_item in discussion_list[:10]:  # 최근 10개만
-                try:
-                    title_elem = discussion_item.find_element(By.TAG_NAME, "a")
-                    title = title_elem.text
-                    
-                    author_elem = discussion_item.find_element(By.CLASS_NAME, "p11")
-                    author = author_elem.text
-                    
-                    date_elem = discussion_item.find_element(By.CLASS_NAME, "num")
-                    date = date_elem.text
-                    
-                    discussion_data.append({
-                        "title": title,
-                        "author": author,
-                        "date": date
-                    })
-                    
-                except Exception as discussion_error:
-                    logger.debug(f"개별 토론 수집 실패: {discussion_error}")
-                    continue
+        Returns:
+            정리된 기본 정보
+        """
+        basic_info = {}
+        
+        try:
+            # 종목명, 종목코드, 현재가, 전일대비, 기업개요를 한 번에 조회
+            if info is None:
+                info = self.driver.execute_script(_BASIC_INFO_JS)
             
-            logger.info(f"토론실 {len(discussion_data)}개 수집 완료")
+            for key in ("stock_name", "stock_code", "current_price"):
+                if not info.get(key):
+                    raise ValueError(f"기본 정보 요소를 찾을 수 없습니다: {key}")
             
-        except Exception as e:
-            logger.error(f"토론실 데이터 수집 실패: {e}")
+            basic_info["stock_name"] = info["stock_name"]
+            basic_info["stock_code"] = info["stock_code"]
+            basic_info["current_price"] = info["current_price"].replace(',', '')
             
-        return discussion_data
-    
-    def _get_related_themes(self) -> List[str]:
-        """관련 테마 정보 수집"""
-        themes = []
-        
-        try:
-            # 테마 정보 섹션 찾기
-            theme_section = self.driver.find_element(By.CLASS_NAME, "group_theme")
-            theme_links = theme_section.find_elements(By.TAG_NAME, "a")
+            # 전일대비 - .today .no_exday em (첫 번째: 변동폭, 두 번째: 등락률)
+            price_change_texts = info.get("price_change") or []
+            if len(price_change_texts) >= 2:
+                basic_info["price_change"] = price_change_texts[0].replace(',', '')
+                basic_info["change_rate"] = price_change_texts[1]
             
-            for theme_link in theme_links:
-                theme_text = theme_link.text.strip()
-                if theme_text and theme_text not in themes:
-                    themes.append(theme_text)
+            # 기업개요 - .summary_info p 텍스트
+            basic_info["company_description"] = info.get("company_description") or "정보 없음"
             
-            logger.info(f"관련 테마 {len(themes)}개 수집 완료")
+            logger.info(f"기본 정보 수집 완료: {basic_info['stock_name']} ({basic_info['stock_code']})")
             
         except Exception as e:
-            logger.error(f"관련 테마 수집 실패: {e}")
+            logger.error(f"기본 정보 수집 실패: {e}")
+            # 최소한의 정보라도 수집 시도
+            try:
+                basic_info["stock_name"] = self.driver.title.split(':')[0].strip() if ':' in self.driver.title else "정보 없음"
+            except:
+                basic_info["stock_name"] = "정보 없음"
             
-        return themes
+        return basic_info
     
     def _capture_charts(self, stock_code: str) -> Dict[str, str]:
         """차트 스크린샷 캡처 - 실제 페이지 구조 기반"""
@@ -423,27 +901,23 @@ class StockDataCollector:
         try:
             # 메인 차트 캡처 (현재 표시된 차트)
             try:
-                # 차트 영역 찾기 - 실제 페이지의 #chart 또는 .chart 선택자 사용
-                chart_selectors = ["#chart", ".chart", ".chart_area", ".graph_image"]
-                chart_element = None
-                
-                for selector in chart_selectors:
-                    try:
-                        chart_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        break
-                    except NoSuchElementException:
-                        continue
+                # 차트 영역 찾기 - 실제 페이지의 #chart 또는 .chart 선택자 중 먼저 나타나는 요소 (전체 대기 8초)
+                try:
+                    chart_element = WebDriverWait(self.driver, 8, poll_frequency=0.1).until(EC.any_of(
+                        *(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in MAIN_CHART)
+                    ))
+                except TimeoutException:
+                    chart_element = None
                 
                 if chart_element:
                     # 스크린샷 파일명 생성
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"{stock_code}_main_chart_{timestamp}.{self.config.screenshot.format}"
-                    filepath = self.screenshot_dir / filename
+                    filename = f"{stock_code}_main_chart_{self.current_run_ts}.{self._screenshot_ext}"
+                    filepath = self.current_stock_screenshot_dir / filename
                     
-                    # 엘리먼트 스크린샷
-                    chart_element.screenshot(str(filepath))
-                    chart_paths["main_chart"] = str(filepath)
-                    logger.info(f"메인 차트 캡처 완료: {filename}")
+                    # 차트 영역만 CDP로 캡처
+                    if self._capture_element_cdp(chart_element, str(filepath)):
+                        chart_paths["main_chart"] = str(filepath)
+                        logger.info(f"메인 차트 캡처 완료: {filename}")
                 else:
                     logger.warning("차트 영역을 찾을 수 없음")
                     
@@ -452,13 +926,12 @@ class StockDataCollector:
             
             # 전체 페이지 스크린샷도 캡처 (백업용)
             try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                full_filename = f"{stock_code}_full_page_{timestamp}.{self.config.screenshot.format}"
-                full_filepath = self.screenshot_dir / full_filename
+                full_filename = f"{stock_code}_full_page_{self.current_run_ts}.{self._fallback_ext}"
+                full_filepath = self.current_stock_screenshot_dir / full_filename
                 
-                self.driver.save_screenshot(str(full_filepath))
-                chart_paths["full_page"] = str(full_filepath)
-                logger.info(f"전체 페이지 캡처 완료: {full_filename}")
+                if self._take_basic_screenshot(str(full_filepath), fallback=True):
+                    chart_paths["full_page"] = str(full_filepath)
+                    logger.info(f"전체 페이지 캡처 완료: {full_filename}")
                 
             except Exception as full_error:
                 logger.error(f"전체 페이지 캡처 실패: {full_error}")
@@ -471,35 +944,61 @@ class StockDataCollector:
             
         return chart_paths
     
-    def _get_financial_data(self) -> Dict[str, any]:
-        """재무제표 정보 수집"""
-        financial_data = {}
+    def _load_cached_stock_data(self, stock_code: str) -> Optional[StockData]:
+        """
+        유효 시간 안에 수집된 종목 데이터가 있으면 반환
         
-        try:
-            # 재무제표 탭으로 이동
-            finance_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'재무제표')]")
-            finance_tab.click()
-            time.sleep(2)
-            
-            # 주요 재무 지표 수집
-            finance_table = self.driver.find_element(By.CLASS_NAME, "tb_type1_ifrs")
-            rows = finance_table.find_elements(By.TAG_NAME, "tr")
-            
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "th") + row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 2:
-                    label = cells[0].text.strip()
-                    value = cells[1].text.strip() if len(cells) > 1 else "N/A"
-                    
-                    if label:
-                        financial_data[label] = value
+        Args:
+            stock_code: 주식 코드
             
-            logger.info(f"재무제표 데이터 수집 완료: {len(financial_data)}개 항목")
+        Returns:
+            캐시된 주식 데이터 또는 None
+        """
+        ttl = self.config.naver_finance.cache_ttl_seconds
+        if ttl <= 0:
+            return None
+        
+        cache_path = self.cache_dir / f"{stock_code}.json"
+        try:
+            cached_at = cache_path.stat().st_mtime
+            if time.time() - cached_at >= ttl:
+                return None
             
+            stock_data = StockData.from_dict(json.loads(cache_path.read_bytes()))
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"재무제표 수집 실패: {e}")
-            
-        return financial_data
+            logger.warning(f"수집 캐시 로드 실패: {e}")
+            return None
+        
+        # 스크린샷 파일이 지워졌으면 캐시를 쓰지 않음
+        if not all(os.path.exists(path) for path in stock_data.chart_screenshots.values()):
+            return None
+        
+        # 이전 시세·스크린샷이 그대로 AI 서비스로 전달되므로 수집 시각을 알림
+        cached_time = datetime.fromtimestamp(cached_at).strftime("%Y-%m-%d %H:%M:%S")
+        logger.info(f"최근 수집 결과 사용 (캐시, {cached_time} 수집): {stock_code}")
+        return stock_data
+    
+    def _save_cached_stock_data(self, stock_data: StockData) -> None:
+        """
+        수집 결과를 종목 코드별 캐시에 저장
+        
+        Args:
+            stock_data: 저장할 주식 데이터
+        """
+        if self.config.naver_finance.cache_ttl_seconds <= 0:
+            return
+        
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache_path = self.cache_dir / f"{stock_data.stock_code}.json"
+            if orjson is not None:
+                cache_path.write_bytes(orjson.dumps(asdict(stock_data)))
+            else:
+                cache_path.write_text(json.dumps(asdict(stock_data), ensure_ascii=False), encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"수집 캐시 저장 실패: {e}")
     
     def collect_stock_data(self, stock_code: str) -> Optional[StockData]:
         """
@@ -511,18 +1010,33 @@ class StockDataCollector:
         Returns:
             수집된 주식 데이터 또는 None
         """
+        cached = self._load_cached_stock_data(stock_code)
+        if cached is not None:
+            return cached
+        
         try:
             logger.info(f"주식 데이터 수집 시작: {stock_code}")
             
-            # 드라이버 설정
-            self._setup_driver()
+            # 1. 기본 정보는 스크린샷이 필요 없으므로 HTTP로 먼저 조회
+            http_info = self._fetch_basic_info(stock_code)
             
-            # 주식 페이지로 이동
-            if not self._navigate_to_stock(stock_code):
-                return None
+            # 드라이버는 처음 사용할 때만 띄우고 이후 수집에서 재사용
+            if self.driver is None:
+                self._setup_driver()
             
-            # 1. 기본 종목 페이지에서 기본 정보 수집
-            basic_info = self._get_basic_info()
+            if http_info is not None:
+                basic_info = self._get_basic_info(http_info)
+            else:
+                # 주식 페이지로 이동 (기본 정보만 읽으므로 이미지·광고 리소스 차단)
+                self._enable_resource_blocking()
+                try:
+                    if not self._navigate_to_stock(stock_code):
+                        return None
+                    
+                    basic_info = self._get_basic_info()
+                finally:
+                    # 이후 페이지(및 재사용되는 드라이버의 다음 종목)는 스크린샷을 찍으므로 실패해도 차단 해제
+                    self._disable_resource_blocking()
             
             # 주식 이름을 가져온 후 스크린샷 폴더 생성
             stock_name = basic_info.get("stock_name", "")
@@ -563,20 +1077,126 @@ class StockDataCollector:
             )
             
             logger.info(f"전문 주식 데이터 수집 완료: {stock_code} ({basic_info.get('stock_name', '')}) - 종목분석, 뉴스, 매매동향, 고급차트 포함")
+            self._save_cached_stock_data(stock_data)
             return stock_data
             
         except Exception as e:
             logger.error(f"주식 데이터 수집 실패: {e}")
-            # 오류 발생 시에만 드라이버 종료
-            self._close_driver()
+            # 드라이버 수명은 호출자가 관리하고, 브라우저가 죽은 경우에만 정리
+            if self.driver is not None and not self._driver_alive():
+                self._close_driver()
             return None
     
+    def collect_many(
+        self,
+        stock_codes: List[str],
+        max_workers: int = 3
+    ) -> Dict[str, Optional[StockData]]:
+        """
+        여러 종목을 작업 프로세스별 Chrome으로 동시에 수집
+        
+        Args:
+            stock_codes: 주식 코드 리스트
+            max_workers: 동시에 실행할 Chrome 수
+            
+        Returns:
+            종목 코드별 수집 결과 (입력 순서, 실패 시 None)
+        """
+        unique_codes = list(dict.fromkeys(stock_codes))
+        if not unique_codes:
+            return {}
+        
+        results = dict(self._iter_collect_in_workers(unique_codes, max_workers))
+        
+        logger.info(
+            f"여러 종목 수집 완료: {sum(r is not None for r in results.values())}/{len(unique_codes)} 성공"
+        )
+        
+        return {stock_code: results[stock_code] for stock_code in unique_codes}
+    
+    def iter_stock_data(self, stock_codes: Iterable[str], max_workers: int = 1) -> Iterator[StockData]:
+        """
+        여러 종목을 수집하면서 완료된 결과를 하나씩 반환 (전체 결과를 메모리에 모으지 않음)
+        
+        Args:
+            stock_codes: 주식 코드 목록
+            max_workers: 동시에 실행할 Chrome 수 (1이면 현재 드라이버로 순서대로 수집)
+            
+        Yields:
+            수집에 성공한 주식 데이터 (병렬 수집이면 완료 순서)
+        """
+        if max_workers <= 1:
+            for stock_code in stock_codes:
+                stock_data = self.collect_stock_data(stock_code)
+                if stock_data is not None:
+                    yield stock_data
+            return
+        
+        unique_codes = list(dict.fromkeys(stock_codes))
+        if not unique_codes:
+            return
+        
+        for _, stock_data in self._iter_collect_in_workers(unique_codes, max_workers):
+            if stock_data is not None:
+                yield stock_data
+    
+    def _iter_collect_in_workers(
+        self,
+        unique_codes: List[str],
+        max_workers: int
+    ) -> Iterator[Tuple[str, Optional[StockData]]]:
+        """
+        작업 프로세스별 Chrome으로 종목을 수집하고 완료되는 대로 반환
+        
+        Args:
+            unique_codes: 중복 없는 주식 코드 리스트
+            max_workers: 동시에 실행할 Chrome 수
+            
+        Yields:
+            (주식 코드, 수집 결과 또는 None)
+        """
+        workers = min(max_workers, len(unique_codes))
+        
+        # 작업 프로세스마다 겹치지 않는 프로필 슬롯 배정 (같은 프로필을 두 Chrome이 동시에 쓰지 않도록)
+        mp_context = multiprocessing.get_context("spawn")
+        slots = mp_context.Queue()
+        for slot in range(workers):
+            slots.put(slot)
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_collect_worker,
+            initargs=(slots, self.profile_dir)
+        ) as executor:
+            futures = {
+                executor.submit(_collect_in_worker, self.config, stock_code): stock_code
+                for stock_code in unique_codes
+            }
+            
+            for future in as_completed(futures):
+                # 완료된 future는 목록에서 빼서 결과가 넘겨진 뒤 메모리에 남지 않게 함
+                stock_code = futures.pop(future)
+                try:
+                    stock_data = future.result()
+                except Exception as e:
+                    logger.error(f"종목 수집 작업 실패: {stock_code} - {e}")
+                    stock_data = None
+                yield stock_code, stock_data
+    
     def close_driver_if_needed(self) -> None:
         """
-        필요한 경우 드라이버를 수동으로 종료
+        필요한 경우 드라이버와 HTTP 세션을 수동으로 종료
         AI 업로드 완료 후 호출할 수 있음
         """
         self._close_driver()
+        self._close_http_session()
+    
+    def __enter__(self) -> "StockDataCollector":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close_driver_if_needed()
     
     def _capture_company_analysis(self, stock_code: str) -> Dict[str, str]:
         """종목분석 페이지 스크롤 캡처 (coinfo.naver)"""
@@ -584,22 +1204,24 @@ class StockDataCollector:
         
         try:
             # 종목분석 페이지로 이동
-            analysis_url = f"https://finance.naver.com/item/coinfo.naver?code={stock_code}"
+            analysis_url = self.config.get_tab_url(stock_code, "analysis")
             logger.info(f"종목분석 페이지 이동: {analysis_url}")
             self.driver.get(analysis_url)
             
             # 브라우저 줌 레벨을 60%로 설정
             self.driver.execute_script("document.body.style.zoom='0.6'")
             
-            time.sleep(5)
+            # 기업정보 iframe이 붙고 로딩이 끝날 때까지 대기
+            self._wait_for_css(COINFO_IFRAME)
+            self._wait_for_page_complete()
             
             # 페이지 처음으로 스크롤
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
             
-            # 전체 페이지 높이 계산
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
+            # 전체 페이지 높이와 화면 크기 계산
+            total_height, viewport_width, viewport_height = self.driver.execute_script(
+                "return [document.body.scrollHeight, window.innerWidth, window.innerHeight]"
+            )
             
             # 스크린샷 번호
             screenshot_count = 1
@@ -608,95 +1230,136 @@ class StockDataCollector:
             # 80% 스크롤 높이로 계산
             scroll_height = int(viewport_height * 0.8)
             
-            # 스크롤하면서 캡처
+            # 화면 높이 단위로 영역을 잘라 캡처 (스크롤·재배치 없이 CDP clip 사용)
             while current_position < total_height:
-                # 현재 위치에서 스크린샷 캡처
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{stock_code}_company_analysis_{screenshot_count:02d}_{timestamp}.{self.config.screenshot.format}"
+                # 현재 위치의 화면 한 장 영역 캡처
+                filename = f"{stock_code}_company_analysis_{screenshot_count:02d}_{self.current_run_ts}.{self._screenshot_ext}"
                 filepath = self.current_stock_screenshot_dir / filename
                 
-                success = self._take_basic_screenshot(str(filepath))
+                clip = {
+                    "x": 0,
+                    "y": current_position,
+                    "width": viewport_width,
+                    "height": min(viewport_height, total_height - current_position)
+                }
+                success = self._take_basic_screenshot(str(filepath), clip=clip)
                 if success:
                     analysis_screenshots[f"analysis_part_{screenshot_count}"] = str(filepath)
                     logger.info(f"종목분석 스크롤 캡처 완료 ({screenshot_count}/{total_height//scroll_height + 1}): {filename}")
                 
-                # 다음 스크롤 위치 계산 (창 높이의 80%로 스크롤)
+                # 다음 캡처 위치 계산 (창 높이의 80%씩 이동)
                 next_position = current_position + scroll_height
                 if next_position >= total_height:
-                    # 마지막 스크롤이면 캡처하지 않고 종료
-                    logger.info("종목분석 마지막 스크롤 도달, 캡처 완료")
+                    # 마지막 영역이면 캡처하지 않고 종료
+                    logger.info("종목분석 마지막 영역 도달, 캡처 완료")
                     break
                 
-                # 다음 위치로 스크롤
-                self.driver.execute_script(f"window.scrollTo(0, {next_position});")
-                time.sleep(2)  # 스크롤 후 로딩 대기
-                
                 current_position = next_position
                 screenshot_count += 1
             
-            logger.info(f"종목분석 스크롤 캡처 완료: 총 {screenshot_count-1}개 스크린샷")
+            logger.info(f"종목분석 스크롤 캡처 완료: 총 {len(analysis_screenshots)}개 스크린샷")
             
         except Exception as e:
             logger.error(f"종목분석 페이지 캡처 실패: {e}")
             
         return analysis_screenshots
     
-    def _get_news_announcements(self, stock_code: str) -> List[Dict[str, str]]:
+    def _scrape_table(
+        self,
+        url: str,
+        stock_code: str,
+        page_name: str,
+        ready_selector: str,
+        row_selector: str,
+        fields: Dict[str, Tuple[str, Optional[str]]],
+        limit: int
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        목록/표 페이지로 이동해 화면을 캡처하고 행 데이터를 추출
+        
+        Args:
+            url: 페이지 URL
+            stock_code: 주식 코드 (스크린샷 파일명용)
+            page_name: 스크린샷 파일명에 붙일 페이지 이름
+            ready_selector: 로딩 완료를 판단할 CSS 선택자
+            row_selector: 행 CSS 선택자
+            fields: 필드 이름 → (행 안의 CSS 선택자, 우선 사용할 속성 또는 None)
+            limit: 최대 행 수
+            
+        Returns:
+            행별 필드 딕셔너리 (필드가 빠진 행은 None)
+        """
+        self._open_and_capture_page(url, stock_code, page_name, ready_selector)
+        
+        # 페이지 소스 한 번으로 행 추출
+        return self._extract_list_items(row_selector, limit, fields)
+    
+    def _open_and_capture_page(
+        self,
+        url: str,
+        stock_code: str,
+        page_name: str,
+        ready_selector: str,
+        blocked_urls: Optional[List[str]] = None
+    ) -> None:
+        """
+        페이지로 이동해 로딩을 기다린 뒤 첫 화면을 캡처
+        
+        Args:
+            url: 페이지 URL
+            stock_code: 주식 코드 (스크린샷 파일명용)
+            page_name: 스크린샷 파일명에 붙일 페이지 이름
+            ready_selector: 로딩 완료를 판단할 CSS 선택자
+            blocked_urls: 이 페이지를 여는 동안 차단할 URL 패턴 (None이면 차단 안 함)
+        """
+        if blocked_urls:
+            self._enable_resource_blocking(blocked_urls)
+        try:
+            self.driver.get(url)
+        finally:
+            # 차단은 페이지 로딩에만 필요하므로 다음 페이지 전에 해제
+            if blocked_urls:
+                self._disable_resource_blocking()
+        
+        # 브라우저 줌 레벨을 60%로 설정
+        self.driver.execute_script("document.body.style.zoom='0.6'")
+        
+        self._wait_for_css(ready_selector)
+        self._wait_for_page_complete()
+        
+        # 기본 스크린샷 캡처
+        self.driver.execute_script("window.scrollTo(0, 0);")
+        
+        filename = f"{stock_code}_{page_name}_{self.current_run_ts}.{self._screenshot_ext}"
+        filepath = self.current_stock_screenshot_dir / filename
+        
+        if self._take_basic_screenshot(str(filepath)):
+            logger.info(f"{page_name} 페이지 스크린샷 완료: {filename}")
+        else:
+            logger.warning(f"{page_name} 페이지 스크린샷 실패: {filename}")
+    
+    def _get_news_announcements(self, stock_code: str) -> List[NewsItem]:
         """뉴스공시 페이지 데이터 수집 (news.naver)"""
         news_data = []
         
         try:
             # 뉴스공시 페이지로 이동
-            news_url = f"https://finance.naver.com/item/news.naver?code={stock_code}"
+            news_url = self.config.get_tab_url(stock_code, "news")
             logger.info(f"뉴스공시 페이지 이동: {news_url}")
-            self.driver.get(news_url)
-            
-            # 브라우저 줌 레벨을 60%로 설정
-            self.driver.execute_script("document.body.style.zoom='0.6'")
-            
-            time.sleep(3)
-            
-            # 기본 스크린샷 캡처
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{stock_code}_news_{timestamp}.{self.config.screenshot.format}"
-            filepath = self.current_stock_screenshot_dir / filename
-            
-            success = self._take_basic_screenshot(str(filepath))
-            if success:
-                logger.info(f"뉴스 페이지 스크린샷 완료: {filename}")
-            else:
-                logger.warning(f"뉴스 페이지 스크린샷 실패: {filename}")
             
-            # 뉴스 리스트 수집
-            news_items = self.driver.find_elements(By.CSS_SELECTOR, ".tb_cont, .newsList li")
+            # 뉴스 리스트 수집 (최대 20개, 제목/날짜/언론사)
+            rows = self._scrape_table(news_url, stock_code, "news", NEWS_PAGE_READY, NEWS_PAGE_ROW, {
+                "title": ("a", "title"),
+                "date": (".date, .wdate", None),
+                "source": (".press, .info_policy", None)
+            }, 20)
             
-            for idx, news_item in enumerate(news_items[:20]):  # 최대 20개
-                try:
-                    # 뉴스 제목
-                    title_elem = news_item.find_element(By.CSS_SELECTOR, "a")
-                    title = title_elem.get_attribute("title") or title_elem.text.strip()
-                    
-                    # 날짜
-                    date_elem = news_item.find_element(By.CSS_SELECTOR, ".date, .wdate")
-                    date = date_elem.text.strip()
-                    
-                    # 언론사
-                    source_elem = news_item.find_element(By.CSS_SELECTOR, ".press, .info_policy")
-                    source = source_elem.text.strip()
-                    
-                    news_data.append({
-                        "title": title,
-                        "date": date,
-                        "source": source,
-                        "index": idx + 1
-                    })
-                    
-                except Exception as news_error:
-                    logger.debug(f"개별 뉴스 수집 실패 (#{idx}): {news_error}")
+            for idx, row in enumerate(rows):
+                if not row:
+                    logger.debug(f"개별 뉴스 수집 실패 (#{idx}): 필드 누락")
                     continue
+                
+                news_data.append(NewsItem(index=idx + 1, **row))
                     
             logger.info(f"뉴스공시 데이터 수집 완료: {len(news_data)}개")
             
@@ -705,62 +1368,138 @@ class StockDataCollector:
             
         return news_data
     
-    def _get_investor_trends(self, stock_code: str) -> List[Dict[str, str]]:
+    def _get_investor_trends(self, stock_code: str) -> List[InvestorTrend]:
         """투자자별 매매동향 페이지 전체 한 장 이미지로 캡처 (frgn.naver)"""
         investor_data = []
         
         try:
             # 투자자별 매매동향 페이지로 이동
-            investor_url = f"https://finance.naver.com/item/frgn.naver?code={stock_code}"
+            investor_url = self.config.get_tab_url(stock_code, "investor")
             logger.info(f"투자자별 매매동향 페이지 이동: {investor_url}")
-            self.driver.get(investor_url)
             
-            # 브라우저 줌 레벨을 60%로 설정
-            self.driver.execute_script("document.body.style.zoom='0.6'")
+            # 표 중심 페이지라 웹폰트와 광고/분석 스크립트는 받지 않음
+            self._open_and_capture_page(
+                investor_url, stock_code, "investor_trends", INVESTOR_TABLE,
+                blocked_urls=_TABLE_PAGE_BLOCKED_URLS
+            )
             
-            time.sleep(3)
+            # 첫 번째 매매동향 표의 헤더 다음 10개 행 셀 텍스트를 한 번의 호출로 조회
+            cells_2d = self.driver.execute_script(_TABLE_CELLS_JS, INVESTOR_TABLE, 10, 6) or []
+            
+            for idx, cells in enumerate(cells_2d):
+                # 구분선 등 데이터가 없는 행은 제외
+                if len(cells) >= 6:
+                    investor_data.append(InvestorTrend(
+                        date=cells[0],
+                        foreign_buy=cells[1],
+                        foreign_sell=cells[2],
+                        institution_buy=cells[3],
+                        institution_sell=cells[4],
+                        individual_volume=cells[5],
+                        index=idx + 1
+                    ))
+                
+            logger.info(f"투자자별 매매동향 수집 완료: {len(investor_data)}개")
             
-            # 기본 스크린샷 캡처
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+        except Exception as e:
+            logger.error(f"투자자별 매매동향 페이지 수집 실패: {e}")
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{stock_code}_investor_trends_{timestamp}.{self.config.screenshot.format}"
-            filepath = self.current_stock_screenshot_dir / filename
+        return investor_data
+    
+    def _find_chart_area(self) -> Tuple[Optional[object], Optional[str]]:
+        """
+        차트 영역 요소 찾기 (section_chart 영역 우선, 없으면 기존 선택자)
+        
+        Returns:
+            (차트 영역 요소, 찾은 선택자 이름) - 없으면 (None, None)
+        """
+        candidates = ((CHART_SECTION, "section_chart"), (CHART_AREA_FALLBACK, "fallback"))
+        if self._chart_area_selector is not None:
+            # 이번 세션에서 찾은 선택자를 먼저 시도 (페이지 구조가 바뀌었으면 전체 후보로 다시 탐색)
+            candidates = (self._chart_area_selector,) + candidates
+        
+        for selector, label in candidates:
+            try:
+                element = self.driver.find_element(By.CSS_SELECTOR, selector)
+            except NoSuchElementException:
+                continue
+            self._chart_area_selector = (selector, label)
+            return element, label
+        return None, None
+    
+    def _capture_chart_area(self, stock_code: str, chart_type: str, korean_name: str) -> Dict[str, str]:
+        """
+        차트 영역 캡처 (찾은 영역 요소를 재사용하고, 없으면 전체 화면 캡처)
+        
+        Args:
+            stock_code: 주식 코드
+            chart_type: 차트 종류 (파일명·키용, 예: month, 1hour)
+            korean_name: 로그용 차트 이름
             
-            success = self._take_basic_screenshot(str(filepath))
-            if success:
-                logger.info(f"투자자별 매매동향 페이지 스크린샷 완료: {filename}")
-            else:
-                logger.warning(f"투자자별 매매동향 페이지 스크린샷 실패: {filename}")
+        Returns:
+            {"chart_<종류>": 경로} 또는 전체 화면 폴백 시 {"chart_<종류>_full": 경로}
+        """
+        filename = f"{stock_code}_chart_{chart_type}_{self.current_run_ts}.{self._screenshot_ext}"
+        filepath = self.current_stock_screenshot_dir / filename
+        
+        # 차트가 다시 그려져 요소가 교체되면 한 번만 다시 찾음
+        for _ in range(2):
+            if self._chart_area is None:
+                self._chart_area = self._find_chart_area()
+            
+            chart_area, label = self._chart_area
+            if chart_area is None:
+                break
             
-            # 투자자별 매매 데이터 테이블 수집
             try:
-                table = self.driver.find_element(By.CSS_SELECTOR, ".type2, .tb_cont")
-                rows = table.find_elements(By.TAG_NAME, "tr")[1:11]  # 헤더 제외 최대 10개
-                
-                for idx, row in enumerate(rows):
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 6:
-                        investor_data.append({
-                            "date": cells[0].text.strip(),
-                            "foreign_buy": cells[1].text.strip(),
-                            "foreign_sell": cells[2].text.strip(),
-                            "institution_buy": cells[3].text.strip(),
-                            "institution_sell": cells[4].text.strip(),
-                            "individual_volume": cells[5].text.strip(),
-                            "index": idx + 1
-                        })
-                        
-            except Exception as table_error:
-                logger.debug(f"투자자별 매매동향 테이블 수집 실패: {table_error}")
+                # 차트 영역만 CDP clip으로 캡처 (전체 화면 캡처 후 자르지 않음)
+                if self._capture_element_cdp(chart_area, str(filepath)):
+                    logger.info(f"{korean_name} 차트 캡처 완료 ({label}): {filename}")
+                    return {f"chart_{chart_type}": str(filepath)}
+                break
+            except StaleElementReferenceException:
+                self._chart_area = None
+        
+        # 전체 페이지 캡처로 폴백
+        filename = f"{stock_code}_chart_{chart_type}_full_{self.current_run_ts}.{self._fallback_ext}"
+        filepath = self.current_stock_screenshot_dir / filename
+        
+        self._take_basic_screenshot(str(filepath), fallback=True)
+        logger.info(f"{korean_name} 차트 전체 페이지 캡처 완료: {filename}")
+        return {f"chart_{chart_type}_full": str(filepath)}
+    
+    def _setup_indicators(self) -> None:
+        """
+        전문 차트에 보조지표(MACD, RSI, Stochastic) 추가
+        
+        지표는 Chrome 사용자 프로필에 저장되므로 현재 드라이버에서 한 번 설정했거나
+        차트에 이미 지표 범례가 있으면 메뉴를 다시 열지 않는다. (다시 클릭하면 지표가 중복 추가됨)
+        """
+        if self._indicators_configured:
+            logger.debug("보조지표 설정 건너뜀 (현재 세션에서 이미 설정)")
+            return
+        
+        try:
+            legend_count = self.driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", STUDY_LEGEND_LABEL
+            )
+            if legend_count >= len(INDICATOR_ITEMS):
+                logger.info(f"프로필에 저장된 보조지표 사용 ({legend_count}개, 설정 건너뜀)")
+            else:
+                # 메뉴 열기와 세 지표 클릭을 한 번의 호출로 실행
+                missing = self.driver.execute_async_script(
+                    _ADD_INDICATORS_JS, INDICATOR_MENU, INDICATOR_MENU_TOGGLE, list(INDICATOR_ITEMS),
+                    STUDY_LEGEND, STUDY_LEGEND_LABEL, 2000
+                )
+                if missing:
+                    raise ValueError(f"지표 요소를 찾을 수 없습니다: {missing}")
                 
-            logger.info(f"투자자별 매매동향 수집 완료: {len(investor_data)}개")
+                logger.info("차트 지표 설정 완료: MACD, RSI, Stochastic")
             
-        except Exception as e:
-            logger.error(f"투자자별 매매동향 페이지 수집 실패: {e}")
+            self._indicators_configured = True
             
-        return investor_data
+        except Exception as indicator_error:
+            logger.warning(f"차트 지표 설정 실패 (계속 진행): {indicator_error}")
     
     def _capture_advanced_charts(self, stock_code: str) -> Dict[str, str]:
         """전문 차트 페이지 전체 한 장 이미지로 캡처 (fchart.naver)"""
@@ -768,41 +1507,26 @@ class StockDataCollector:
         
         try:
             # 전문 차트 페이지로 이동
-            chart_url = f"https://finance.naver.com/item/fchart.naver?code={stock_code}"
+            chart_url = self.config.get_tab_url(stock_code, "chart")
             logger.info(f"전문 차트 페이지 이동: {chart_url}")
             self.driver.get(chart_url)
             
+            # 이전 페이지에서 찾은 차트 영역은 쓰지 않음
+            self._chart_area = None
+            
             # 브라우저 줌 레벨을 60%로 설정
             self.driver.execute_script("document.body.style.zoom='0.6'")
             
-            time.sleep(10)  # 차트 로딩 대기
-            
-            # 차트 지표 설정 (MACD, RSI, Stochastic)
+            # 차트 캔버스가 그려질 때까지 대기
             try:
-                # 1. 지표 메뉴 클릭
-                indicator_menu = self.driver.find_element(By.XPATH, '//*[@id="content"]/div[3]/cq-context/div[1]/div[1]/div/div[2]/cq-menu/span')
-                self.driver.execute_script("arguments[0].click();", indicator_menu)
-                time.sleep(1)
-                
-                # 2. MACD 추가
-                macd_elem = self.driver.find_element(By.XPATH, '//*[@id="content"]/div[3]/cq-context/div[1]/div[1]/div/div[2]/cq-menu/cq-menu-dropdown/cq-scroll/cq-studies/cq-studies-content/cq-item[9]/cq-label')
-                self.driver.execute_script("arguments[0].click();", macd_elem)
-                time.sleep(1)
-                
-                # 3. RSI 추가
-                rsi_elem = self.driver.find_element(By.XPATH, '//*[@id="content"]/div[3]/cq-context/div[1]/div[1]/div/div[2]/cq-menu/cq-menu-dropdown/cq-scroll/cq-studies/cq-studies-content/cq-item[12]')
-                self.driver.execute_script("arguments[0].click();", rsi_elem)
-                time.sleep(1)
-                
-                # 4. Stochastic 추가
-                stoch_elem = self.driver.find_element(By.XPATH, '//*[@id="content"]/div[3]/cq-context/div[1]/div[1]/div/div[2]/cq-menu/cq-menu-dropdown/cq-scroll/cq-studies/cq-studies-content/cq-item[15]')
-                self.driver.execute_script("arguments[0].click();", stoch_elem)
-                time.sleep(2)
-                
-                logger.info("차트 지표 설정 완료: MACD, RSI, Stochastic")
-                
-            except Exception as indicator_error:
-                logger.warning(f"차트 지표 설정 실패 (계속 진행): {indicator_error}")
+                WebDriverWait(self.driver, CHART_LOAD_TIMEOUT, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, CHART_CANVAS))
+                )
+            except TimeoutException:
+                logger.warning("차트 캔버스 로딩 대기 시간 초과 (계속 진행)")
+            
+            # 차트 지표 설정 (MACD, RSI, Stochastic) - 드라이버당 한 번만
+            self._setup_indicators()
             
             # 차트 종류별 개별 캡처 (월/주/일/1시간봉)
             chart_types = [
@@ -815,80 +1539,27 @@ class StockDataCollector:
                 try:
                     # 1. 먼저 차트 탭 클릭
                     try:
-                        chart_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'차트') or @href*='fchart']")
+                        chart_tab = self.driver.find_element(By.CSS_SELECTOR, CHART_TAB)
                         self.driver.execute_script("arguments[0].click();", chart_tab)
-                        time.sleep(2)
+                        self._wait_for_css(f"div.{css_class}")
                         logger.info("차트 탭 클릭 완료")
                     except Exception as tab_error:
                         logger.warning(f"차트 탭 클릭 실패 (계속 진행): {tab_error}")
                     
-                    # 2. JavaScript로 차트 타입 클릭
-                    click_script = f"""
-                    const targetDiv = document.querySelector('div.{css_class}:not(.selected)');
-                    if (targetDiv) {{
-                        const rect = targetDiv.getBoundingClientRect();
-                        const eventOptions = {{
-                            bubbles: true,
-                            cancelable: true,
-                            view: window,
-                            pointerId: 1,
-                            button: 0,
-                            clientX: rect.left + rect.width / 2,
-                            clientY: rect.top + rect.height / 2,
-                            isPrimary: true
-                        }};
-                        targetDiv.dispatchEvent(new PointerEvent('pointerdown', eventOptions));
-                        targetDiv.dispatchEvent(new PointerEvent('pointerup', eventOptions));
-                        return true;
-                    }} else {{
-                        return false;
-                    }}
-                    """
-                    
-                    result = self.driver.execute_script(click_script)
-                    if result:
-                        logger.info(f"{korean_name} 차트 클릭 성공")
-                        if chart_type == "month":
-                            time.sleep(7)  # 월봉은 2초 추가 딜레이 (총 7초)
-                        else:
-                            time.sleep(5)  # 차트 변경 대기
-                    else:
+                    # 2. 차트 타입 탭과 선택 상태 전환 대기를 한 번의 호출로 실행
+                    outcome = self._run_tap_sequence([
+                        (f"div.{css_class}:not(.selected)", f"div.{css_class}.selected")
+                    ])
+                    if outcome["status"] == "missing":
                         logger.warning(f"{korean_name} 차트 요소를 찾을 수 없음")
                         continue
+                    if outcome["status"] == "timeout":
+                        logger.warning(f"{korean_name} 차트 전환 대기 시간 초과 (계속 진행)")
+                    else:
+                        logger.info(f"{korean_name} 차트 클릭 성공")
                     
                     # 3. 차트 영역 캡처 (class="section section_chart inner_sub" 우선)
-                    try:
-                        # 먼저 section section_chart inner_sub 영역 시도
-                        chart_area = self.driver.find_element(By.CSS_SELECTOR, ".section.section_chart.inner_sub")
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"{stock_code}_chart_{chart_type}_{timestamp}.{self.config.screenshot.format}"
-                        filepath = self.current_stock_screenshot_dir / filename
-                        
-                        chart_area.screenshot(str(filepath))
-                        chart_screenshots[f"chart_{chart_type}"] = str(filepath)
-                        logger.info(f"{korean_name} 차트 캡처 완료 (section_chart): {filename}")
-                        
-                    except Exception as section_error:
-                        # section_chart 영역이 없으면 기존 선택자 시도
-                        try:
-                            chart_area = self.driver.find_element(By.CSS_SELECTOR, "cq-context, .chart_area, #chart")
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            filename = f"{stock_code}_chart_{chart_type}_{timestamp}.{self.config.screenshot.format}"
-                            filepath = self.current_stock_screenshot_dir / filename
-                            
-                            chart_area.screenshot(str(filepath))
-                            chart_screenshots[f"chart_{chart_type}"] = str(filepath)
-                            logger.info(f"{korean_name} 차트 캡처 완료 (fallback): {filename}")
-                            
-                        except Exception as area_error:
-                            # 전체 페이지 캡처로 폴백
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            filename = f"{stock_code}_chart_{chart_type}_full_{timestamp}.{self.config.screenshot.format}"
-                            filepath = self.current_stock_screenshot_dir / filename
-                            
-                            self.driver.save_screenshot(str(filepath))
-                            chart_screenshots[f"chart_{chart_type}_full"] = str(filepath)
-                            logger.info(f"{korean_name} 차트 전체 페이지 캡처 완료: {filename}")
+                    chart_screenshots.update(self._capture_chart_area(stock_code, chart_type, korean_name))
                     
                 except Exception as chart_error:
                     logger.error(f"{korean_name} 차트 캡처 실패: {chart_error}")
@@ -898,117 +1569,33 @@ class StockDataCollector:
             try:
                 # 1. 먼저 차트 탭 클릭
                 try:
-                    chart_tab = self.driver.find_element(By.XPATH, "//a[contains(text(),'차트') or @href*='fchart']")
+                    chart_tab = self.driver.find_element(By.CSS_SELECTOR, CHART_TAB)
                     self.driver.execute_script("arguments[0].click();", chart_tab)
-                    time.sleep(2)
+                    self._wait_for_css(f'[stxtap="rangeSetMin()"], {HOUR_INTERVAL_ITEM}')
                     logger.info("1시간봉 캡처를 위한 차트 탭 클릭 완료")
                 except Exception as tab_error:
                     logger.warning(f"차트 탭 클릭 실패 (계속 진행): {tab_error}")
                 
-                # 2. 먼저 분봉 클릭
-                minute_click_script = """
-                const targetItem = document.querySelector('[stxtap="rangeSetMin()"]');
-                if (targetItem) {
-                    // 클릭할 위치를 계산합니다.
-                    const rect = targetItem.getBoundingClientRect();
-                    
-                    // Pointer 이벤트에 필요한 상세 옵션을 정의합니다.
-                    const eventOptions = {
-                        bubbles: true,
-                        cancelable: true,
-                        view: window,
-                        pointerId: 1,      // 포인터의 고유 ID
-                        button: 0,         // 마우스 왼쪽 버튼
-                        clientX: rect.left + rect.width / 2,
-                        clientY: rect.top + rect.height / 2,
-                        isPrimary: true
-                    };
-                
-                    // pointerdown과 pointerup 이벤트를 순서대로 발생시킵니다.
-                    targetItem.dispatchEvent(new PointerEvent('pointerdown', eventOptions));
-                    targetItem.dispatchEvent(new PointerEvent('pointerup', eventOptions));
-                
-                    console.log("✅ '분봉' 항목이 클릭되었습니다.");
-                    return true;
-                } else {
-                    console.error("❌ 실패: '분봉' 항목을 찾지 못했습니다.");
-                    return false;
-                }
-                """
-                
-                minute_result = self.driver.execute_script(minute_click_script)
-                if minute_result:
-                    logger.info("분봉 클릭 성공")
-                    time.sleep(2)  # 분봉 클릭 후 대기
-                else:
+                # 2. 분봉 → 1시간 항목 탭과 각 단계 대기를 한 번의 호출로 실행
+                hour_step = (HOUR_INTERVAL_ITEM, f"{HOUR_INTERVAL_ITEM}.selected")
+                outcome = self._run_tap_sequence([
+                    ('[stxtap="rangeSetMin()"]', HOUR_INTERVAL_ITEM),
+                    hour_step
+                ])
+                if outcome["status"] == "missing" and outcome["step"] == 0:
+                    # 분봉 항목이 없어도 1시간 항목은 바로 시도
                     logger.warning("분봉 요소를 찾을 수 없음")
-                
-                # 이제 1시간봉 클릭
-                hour_click_script = """
-                const targetItem = document.querySelector('cq-item[interval="60"]');
-                if (targetItem) {
-                    const rect = targetItem.getBoundingClientRect();
-                    const eventOptions = {
-                        bubbles: true,
-                        cancelable: true,
-                        view: window,
-                        pointerId: 1,
-                        button: 0,
-                        clientX: rect.left + rect.width / 2,
-                        clientY: rect.top + rect.height / 2,
-                        isPrimary: true
-                    };
-                    targetItem.dispatchEvent(new PointerEvent('pointerdown', eventOptions));
-                    targetItem.dispatchEvent(new PointerEvent('pointerup', eventOptions));
-                    return true;
-                } else {
-                    return false;
-                }
-                """
-                
-                result = self.driver.execute_script(hour_click_script)
-                if result:
-                    logger.info("1시간봉 차트 클릭 성공")
-                    time.sleep(5)  # 차트 변경 대기
-                else:
+                    outcome = self._run_tap_sequence([hour_step])
+                if outcome["status"] == "missing":
                     logger.warning("1시간봉 차트 요소를 찾을 수 없음")
                     raise Exception("1시간봉 요소 찾기 실패")
+                if outcome["status"] == "timeout":
+                    logger.warning("1시간봉 차트 전환 대기 시간 초과 (계속 진행)")
+                else:
+                    logger.info("1시간봉 차트 클릭 성공")
                 
-                # 1시간봉 차트 대기시간 증가 후 캡처 (class="section section_chart inner_sub" 우선)
-                time.sleep(3)  # 추가 대기시간 (총 8초)
-                
-                try:
-                    # 먼저 section section_chart inner_sub 영역 시도
-                    chart_area = self.driver.find_element(By.CSS_SELECTOR, ".section.section_chart.inner_sub")
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"{stock_code}_chart_1hour_{timestamp}.{self.config.screenshot.format}"
-                    filepath = self.current_stock_screenshot_dir / filename
-                    
-                    chart_area.screenshot(str(filepath))
-                    chart_screenshots["chart_1hour"] = str(filepath)
-                    logger.info(f"1시간봉 차트 캡처 완료 (section_chart): {filename}")
-                    
-                except Exception as section_error:
-                    # section_chart 영역이 없으면 기존 선택자 시도
-                    try:
-                        chart_area = self.driver.find_element(By.CSS_SELECTOR, "cq-context, .chart_area, #chart")
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"{stock_code}_chart_1hour_{timestamp}.{self.config.screenshot.format}"
-                        filepath = self.current_stock_screenshot_dir / filename
-                        
-                        chart_area.screenshot(str(filepath))
-                        chart_screenshots["chart_1hour"] = str(filepath)
-                        logger.info(f"1시간봉 차트 캡처 완료 (fallback): {filename}")
-                        
-                    except Exception as area_error:
-                        # 전체 페이지 캡처로 폴백
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"{stock_code}_chart_1hour_full_{timestamp}.{self.config.screenshot.format}"
-                        filepath = self.current_stock_screenshot_dir / filename
-                        
-                        self.driver.save_screenshot(str(filepath))
-                        chart_screenshots["chart_1hour_full"] = str(filepath)
-                        logger.info(f"1시간봉 차트 전체 페이지 캡처 완료: {filename}")
+                # 1시간봉 차트 캡처 (class="section section_chart inner_sub" 우선)
+                chart_screenshots.update(self._capture_chart_area(stock_code, "1hour", "1시간봉"))
                 
             except Exception as hour_error:
                 logger.error(f"1시간봉 차트 캡처 실패: {hour_error}")
@@ -1021,13 +1608,19 @@ class StockDataCollector:
             
         return chart_screenshots
     
-    def save_data_to_json(self, stock_data: StockData, filepath: Optional[str] = None) -> str:
+    def save_data_to_json(
+        self,
+        stock_data: StockData,
+        filepath: Optional[str] = None,
+        pretty: bool = False
+    ) -> str:
         """
         수집된 데이터를 JSON 파일로 저장
         
         Args:
             stock_data: 저장할 주식 데이터
             filepath: 저장할 파일 경로 (None이면 자동 생성)
+            pretty: True면 들여쓰기해서 저장 (기본은 더 빠른 압축 형식)
             
         Returns:
             저장된 파일 경로
@@ -1035,35 +1628,247 @@ class StockDataCollector:
         if filepath is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{stock_data.stock_code}_{timestamp}.json"
-            filepath = self.screenshot_dir.parent / "data" / filename
+            filepath = self.base_screenshot_dir.parent / "data" / filename
             filepath.parent.mkdir(exist_ok=True)
         
         try:
-            # dataclass를 dict로 변환
-            data_dict = {
-                "stock_code": stock_data.stock_code,
-                "stock_name": stock_data.stock_name,
-                "current_price": stock_data.current_price,
-                "price_change": stock_data.price_change,
-                "change_rate": stock_data.change_rate,
-                "volume": stock_data.volume,
-                "market_cap": stock_data.market_cap,
-                "investment_opinion": stock_data.investment_opinion,
-                "news_data": stock_data.news_data,
-                "discussion_data": stock_data.discussion_data,
-                "related_themes": stock_data.related_themes,
-                "chart_screenshots": stock_data.chart_screenshots,
-                "financial_data": stock_data.financial_data,
-                "technical_indicators": stock_data.technical_indicators,
-                "collected_at": stock_data.collected_at
-            }
+            # dataclass를 dict로 변환 (중첩 항목 포함)
+            data_dict = asdict(stock_data)
+            
+            # 직렬화한 바이트를 한 번에 기록
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                data_bytes = orjson.dumps(data_dict, option=option)
+            else:
+                data_bytes = json.dumps(
+                    data_dict,
+                    ensure_ascii=False,
+                    indent=2 if pretty else None,
+                    separators=None if pretty else (',', ':')
+                ).encode('utf-8')
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data_dict, f, ensure_ascii=False, indent=2)
+            Path(filepath).write_bytes(data_bytes)
             
             logger.info(f"데이터 JSON 저장 완료: {filepath}")
             return str(filepath)
             
         except Exception as e:
             logger.error(f"JSON 저장 실패: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def save_data_to_jsonl(self, stock_data_iter: Iterable[StockData], filepath: Optional[str] = None) -> str:
+        """
+        주식 데이터를 받는 대로 JSONL 파일에 한 줄씩 기록 (iter_stock_data와 함께 사용)
+        
+        Args:
+            stock_data_iter: 주식 데이터 이터러블
+            filepath: 저장할 파일 경로 (None이면 data/stocks_YYYYMMDD_HHMMSS.jsonl)
+            
+        Returns:
+            저장된 파일 경로
+        """
+        if filepath is None:
+            filepath = self._jsonl_path(datetime.now().strftime("%Y%m%d_%H%M%S"))
+        
+        # 줄마다 append_data_to_jsonl과 같은 잠금·추가 모드로 기록 (같은 파일에 쓰는 다른 기록과 섞이지 않음)
+        count = 0
+        for stock_data in stock_data_iter:
+            self.append_data_to_jsonl(stock_data, filepath)
+            count += 1
+        
+        logger.info(f"데이터 JSONL 저장 완료: {filepath} ({count}개 종목)")
+        return str(filepath)
+    
+    def append_data_to_jsonl(self, stock_data: StockData, filepath: Optional[str] = None) -> str:
+        """
+        주식 데이터를 공용 JSONL 로그 끝에 한 줄로 덧붙임 (종목마다 파일을 만들지 않음)
+        
+        Args:
+            stock_data: 저장할 주식 데이터
+            filepath: JSONL 로그 경로 (None이면 날짜별 로그 data/stocks_YYYYMMDD.jsonl)
+            
+        Returns:
+            기록한 파일 경로
+        """
+        if filepath is None:
+            filepath = self._jsonl_path(datetime.now().strftime("%Y%m%d"))
+        
+        line = stock_data.to_json_line()
+        
+        # 한 줄을 한 번의 write로 기록 (append 모드라 다른 프로세스와도 줄 단위로 이어 붙음)
+        with _jsonl_lock, open(filepath, 'ab') as f:
+            f.write(line)
+        
+        logger.info(f"데이터 JSONL 로그 추가 완료: {filepath} ({stock_data.stock_code})")
+        return str(filepath)
+    
+    def _jsonl_path(self, stamp: str) -> Path:
+        """
+        기본 JSONL 파일 경로 (data/stocks_<stamp>.jsonl, 디렉토리가 없으면 생성)
+        
+        Args:
+            stamp: 파일명에 붙일 날짜/시각 문자열
+            
+        Returns:
+            JSONL 파일 경로
+        """
+        filepath = self.base_screenshot_dir.parent / "data" / f"stocks_{stamp}.jsonl"
+        filepath.parent.mkdir(exist_ok=True)
+        return filepath
+
+
+# collect_many 작업 프로세스의 Chrome 프로필 경로와 재사용할 수집기
+_worker_profile_dir: Optional[str] = None
+_worker_collector: Optional[StockDataCollector] = None
+
+
+def _init_collect_worker(slots, base_profile_dir: str) -> None:
+    """
+    collect_many 작업 프로세스 초기화 (프로필 슬롯 할당)
+    
+    Args:
+        slots: 사용 가능한 프로필 슬롯 번호 큐
+        base_profile_dir: 복사해 사용할 기본 프로필 경로
+    """
+    global _worker_profile_dir
+    
+    _worker_profile_dir = _prepare_worker_profile(base_profile_dir, slots.get())
+
+
+def _prepare_worker_profile(base_profile_dir: str, slot: int) -> str:
+    """
+    병렬 수집용 슬롯별 Chrome 프로필 준비
+    
+    Args:
+        base_profile_dir: 복사해 사용할 기본 프로필 경로
+        slot: 프로필 슬롯 번호
+        
+    Returns:
+        슬롯 프로필 경로
+    """
+    profile_dir = f"{base_profile_dir}_worker{slot}"
+    
+    # 처음 사용하는 슬롯은 기본 프로필(보조지표 설정 포함)을 복사해서 시작
+    if not os.path.exists(profile_dir) and os.path.isdir(base_profile_dir):
+        try:
+            shutil.copytree(base_profile_dir, profile_dir, ignore=shutil.ignore_patterns("Singleton*"))
+        except Exception as e:
+            logger.warning(f"작업 프로필 복사 실패, 빈 프로필로 시작: {e}")
+    
+    return profile_dir
+
+
+def _collect_in_worker(config: Config, stock_code: str) -> Optional[StockData]:
+    """
+    작업 프로세스에서 단일 종목 수집 (드라이버는 프로세스 종료 시까지 재사용)
+    
+    Args:
+        config: 설정 객체
+        stock_code: 주식 코드
+        
+    Returns:
+        수집된 주식 데이터 또는 None
+    """
+    global _worker_collector
+    
+    if _worker_collector is None:
+        _worker_collector = StockDataCollector(config, profile_dir=_worker_profile_dir)
+        atexit.register(_worker_collector.close_driver_if_needed)
+    
+    return _worker_collector.collect_stock_data(stock_code)
+
+
+class BrowserPool:
+    """
+    여러 종목을 동시에 수집하는 Chrome 풀 (스레드별로 수집기를 빌려 사용)
+    
+    collect_many의 프로세스 풀과 달리 Chrome을 배치가 끝나도 닫지 않고 유지하므로,
+    여러 배치를 연달아 수집할 때 실행 비용을 한 번만 낸다. 드라이버 하나는 한 번에
+    한 스레드만 사용한다.
+    """
+    
+    def __init__(self, config: Config, size: int = 3, base_profile_dir: str = DEFAULT_PROFILE_DIR):
+        """
+        풀 초기화 (Chrome은 처음 사용할 때 또는 warm_up에서 실행)
+        
+        Args:
+            config: 설정 객체
+            size: 동시에 실행할 Chrome 수
+            base_profile_dir: 슬롯 프로필로 복사할 기본 프로필 경로
+        """
+        self.size = size
+        self._collectors = [
+            StockDataCollector(config, profile_dir=_prepare_worker_profile(base_profile_dir, slot))
+            for slot in range(size)
+        ]
+        self._idle: "queue.Queue[StockDataCollector]" = queue.Queue()
+        for collector in self._collectors:
+            self._idle.put(collector)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="browser-pool")
+    
+    @contextmanager
+    def lease(self) -> Iterator[StockDataCollector]:
+        """쉬고 있는 수집기 하나를 빌려 사용하고 반납"""
+        collector = self._idle.get()
+        try:
+            yield collector
+        finally:
+            self._idle.put(collector)
+    
+    def _collect_one(self, stock_code: str) -> Optional[StockData]:
+        """빌린 수집기로 단일 종목 수집"""
+        with self.lease() as collector:
+            return collector.collect_stock_data(stock_code)
+    
+    def _launch(self, collector: StockDataCollector) -> None:
+        """수집기의 Chrome 미리 실행"""
+        if collector.driver is None:
+            collector._setup_driver()
+    
+    def warm_up(self) -> None:
+        """모든 슬롯의 Chrome을 미리 실행"""
+        for future in [self._executor.submit(self._launch, c) for c in self._collectors]:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Chrome 미리 실행 실패: {e}")
+    
+    def collect_many(self, stock_codes: List[str]) -> Dict[str, Optional[StockData]]:
+        """
+        여러 종목을 풀의 Chrome으로 동시에 수집
+        
+        Args:
+            stock_codes: 주식 코드 리스트
+            
+        Returns:
+            종목 코드별 수집 결과 (입력 순서, 실패 시 None)
+        """
+        unique_codes = list(dict.fromkeys(stock_codes))
+        futures = {stock_code: self._executor.submit(self._collect_one, stock_code) for stock_code in unique_codes}
+        
+        results: Dict[str, Optional[StockData]] = {}
+        for stock_code, future in futures.items():
+            try:
+                results[stock_code] = future.result()
+            except Exception as e:
+                logger.error(f"종목 수집 작업 실패: {stock_code} - {e}")
+                results[stock_code] = None
+        
+        logger.info(
+            f"브라우저 풀 수집 완료: {sum(r is not None for r in results.values())}/{len(unique_codes)} 성공"
+        )
+        return results
+    
+    def close(self) -> None:
+        """작업 스레드와 모든 Chrome 종료"""
+        self._executor.shutdown(wait=True)
+        for collector in self._collectors:
+            collector.close_driver_if_needed()
+    
+    def __enter__(self) -> "BrowserPool":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
\ No newline at end of file
@@ -4,12 +4,38 @@
 """
 
 import os
+import re
 import sys
 from typing import Optional, Dict, List
 from dataclasses import dataclass
 
 # keyboard 모듈 제거 - 표준 input() 사용
 KEYBOARD_AVAILABLE = False
+
+# ANSI 화면 지우기 + 커서 홈 (clear 프로세스를 띄우지 않음)
+_CLEAR_SCREEN = "\033[2J\033[H"
+
+# 주식 코드 형식 (6자리 숫자)
+_STOCK_CODE_RE = re.compile(r"\d{6}")
+
+# 주식 코드 입력 안내 (한 번에 출력)
+_STOCK_CODE_PROMPT = "\n".join([
+    "",
+    "=" * 50,
+    "📈 주식 코드 입력",
+    "=" * 50,
+    "",
+    "💡 입력 예시:",
+    "• 삼성전자: 005930",
+    "• SK하이닉스: 000660",
+    "• NAVER: 035420",
+    "• 카카오: 035720",
+    "",
+    "🎯 단축키:",
+    "• q: 전략 선택으로 돌아가기",
+    "• exit: 프로그램 종료",
+    ""
+])
     
 from loguru import logger
 
@@ -59,10 +85,25 @@ class StrategySelector:
             'valuation_analysis': '\033[95m',        # 자주색
             'reset': '\033[0m'                       # 색상 리셋
         }
+        
+        # 전략 설명은 세션 중 바뀌지 않으므로 한 번만 조회 (메뉴 새로고침마다 재조회하지 않음)
+        # 템플릿 내용은 PromptManager가 이미 메모리에 캐시함
+        self._descriptions: Dict[str, str] = {
+            strategy_name: prompt_manager.get_strategy_description(strategy_name)
+            for strategy_name in {*self.strategy_keys.values(), *self.available_strategies}
+        }
+        
+        # 고정된 메뉴/도움말 문자열은 미리 만들어 두고 한 번에 출력
+        self._menu_text = self._build_menu_text()
+        self._help_text = self._build_help_text()
     
     def _clear_screen(self) -> None:
         """화면 클리어"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
     
     def _print_header(self) -> None:
         """헤더 출력"""
@@ -71,31 +112,78 @@ class StrategySelector:
         print("=" * 80)
         print()
     
-    def _print_strategy_menu(self) -> None:
-        """전략 메뉴 출력"""
-        print("📋 사용 가능한 분석 전략:")
-        print()
+    def _build_menu_text(self) -> str:
+        """
+        전략 메뉴 문자열 생성
+        
+        Returns:
+            헤더 아래에 출력할 전략 메뉴 전체 문자열
+        """
+        reset = self.colors['reset']
+        lines = ["📋 사용 가능한 분석 전략:", ""]
         
         for key, strategy_name in self.strategy_keys.items():
             color = self.colors.get(strategy_name, '')
-            reset = self.colors['reset']
-            description = self.prompt_manager.get_strategy_description(strategy_name)
-            
-            print(f"{color}[{key}] {description}{reset}")
+            lines.append(f"{color}[{key}] {self._descriptions[strategy_name]}{reset}")
+        
+        lines += [
+            "",
+            "🎯 단축키:",
+            "• Enter: 기본 전략 (매직스플릿 최적화)",
+            "• q: 프로그램 종료",
+            "• r: 화면 새로고침",
+            "• h: 도움말 보기",
+            ""
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def _build_help_text(self) -> str:
+        """
+        도움말 문자열 생성
         
-        print()
-        print("🎯 단축키:")
-        print("• Enter: 기본 전략 (매직스플릿 최적화)")
-        print("• q: 프로그램 종료")
-        print("• r: 화면 새로고침")
-        print("• h: 도움말 보기")
-        print()
+        Returns:
+            도움말 전체 문자열
+        """
+        lines = [
+            "",
+            "=" * 60,
+            "📖 MagicSplitGPT 사용 가이드",
+            "=" * 60,
+            "",
+            "🎯 전략별 특징:"
+        ]
+        
+        for key, strategy_name in self.strategy_keys.items():
+            lines.append(f"  [{key}] {self._descriptions[strategy_name]}")
+        
+        lines += [
+            "",
+            "💡 사용 방법:",
+            "1. 숫자 키 (1-5)로 원하는 전략 선택",
+            "2. 주식 코드 입력 (예: 005930, 000660)",
+            "3. 데이터 수집 및 AI 서비스 업로드 자동 진행",
+            "4. 각 AI 서비스에서 분석 결과 확인",
+            "",
+            "⚙️ 매직스플릿 시스템 특징:",
+            "• 1차 매수 후 설정 비율 상승시 익절",
+            "• 15% 하락시마다 자동 추가매수",
+            "• 15% 상승시마다 단계적 익절",
+            "• 변동성이 큰 종목에서 높은 수익률",
+            "",
+            "Press any key to continue..."
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def _print_strategy_menu(self) -> None:
+        """전략 메뉴 출력"""
+        sys.stdout.write(self._menu_text)
+        sys.stdout.flush()
     
     def _print_strategy_details(self, strategy_name: str) -> None:
         """선택한 전략의 상세 정보 출력"""
         color = self.colors.get(strategy_name, '')
         reset = self.colors['reset']
-        description = self.prompt_manager.get_strategy_description(strategy_name)
+        description = self._descriptions[strategy_name]
         
         print(f"\n{color}📊 선택된 전략: {description}{reset}")
         
@@ -112,28 +200,8 @@ class StrategySelector:
     
     def _print_help(self) -> None:
         """도움말 출력"""
-        print("\n" + "="*60)
-        print("📖 MagicSplitGPT 사용 가이드")
-        print("="*60)
-        
-        print("\n🎯 전략별 특징:")
-        for key, strategy_name in self.strategy_keys.items():
-            description = self.prompt_manager.get_strategy_description(strategy_name)
-            print(f"  [{key}] {description}")
-        
-        print("\n💡 사용 방법:")
-        print("1. 숫자 키 (1-5)로 원하는 전략 선택")
-        print("2. 주식 코드 입력 (예: 005930, 000660)")
-        print("3. 데이터 수집 및 AI 서비스 업로드 자동 진행")
-        print("4. 각 AI 서비스에서 분석 결과 확인")
-        
-        print("\n⚙️ 매직스플릿 시스템 특징:")
-        print("• 1차 매수 후 설정 비율 상승시 익절")
-        print("• 15% 하락시마다 자동 추가매수")
-        print("• 15% 상승시마다 단계적 익절")
-        print("• 변동성이 큰 종목에서 높은 수익률")
-        
-        print("\nPress any key to continue...")
+        sys.stdout.write(self._help_text)
+        sys.stdout.flush()
         input()
     
     def _validate_strategy_selection(self, user_input: str) -> Optional[str]:
@@ -220,7 +288,7 @@ class StrategySelector:
                     # 전략 선택 결과 반환
                     choice = StrategyChoice(
                         strategy_name=strategy_name,
-                        strategy_description=self.prompt_manager.get_strategy_description(strategy_name),
+                        strategy_description=self._descriptions[strategy_name],
                         template_content=template_content,
                         user_confirmed=True
                     )
@@ -267,7 +335,7 @@ class StrategySelector:
         
         choice = StrategyChoice(
             strategy_name=strategy_name,
-            strategy_description=self.prompt_manager.get_strategy_description(strategy_name),
+            strategy_description=self._descriptions[strategy_name],
             template_content=template_content,
             user_confirmed=True
         )
@@ -282,19 +350,8 @@ class StrategySelector:
         Returns:
             입력된 주식 코드 또는 None (취소)
         """
-        print("\n" + "="*50)
-        print("📈 주식 코드 입력")
-        print("="*50)
-        
-        print("\n💡 입력 예시:")
-        print("• 삼성전자: 005930")
-        print("• SK하이닉스: 000660") 
-        print("• NAVER: 035420")
-        print("• 카카오: 035720")
-        
-        print("\n🎯 단축키:")
-        print("• q: 전략 선택으로 돌아가기")
-        print("• exit: 프로그램 종료")
+        sys.stdout.write(_STOCK_CODE_PROMPT)
+        sys.stdout.flush()
         
         while True:
             try:
@@ -318,7 +375,7 @@ class StrategySelector:
                     continue
                 
                 # 숫자만 있고 6자리인지 확인
-                if not stock_code.isdigit() or len(stock_code) != 6:
+                if not _STOCK_CODE_RE.fullmatch(stock_code):
                     print("❌ 주식 코드는 6자리 숫자여야 합니다. (예: 005930)")
                     continue
                 
@@ -360,7 +417,7 @@ class StrategySelector:
         for strategy in self.available_strategies:
             template_info = self.prompt_manager.get_template_info(strategy)
             stats["strategy_details"][strategy] = {
-                "description": self.prompt_manager.get_strategy_description(strategy),
+                "description": self._descriptions[strategy],
                 "template_exists": template_info["exists"],
                 "template_valid": template_info["valid"],
                 "template_size": template_info["size"]